@@ -3,22 +3,224 @@ AWS Bedrock Monitoring Architecture Diagram Generator
 Creates a visual representation of the monitoring solution architecture
 """
 
+import hashlib
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+import matplotlib
+
+# Only bring up a GUI backend when the diagrams can actually be shown;
+# batch/CI runs use Agg, which is all that savefig needs
+INTERACTIVE = sys.stdout.isatty() and bool(os.environ.get('DISPLAY'))
+if not INTERACTIVE:
+    matplotlib.use('Agg')
 import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.patches import FancyBboxPatch, ConnectionPatch
+import matplotlib.colors as mcolors
+from matplotlib.patches import FancyBboxPatch
+from matplotlib.collections import PatchCollection, LineCollection
+from matplotlib.font_manager import FontProperties, findfont
 import numpy as np
 
-def create_architecture_diagram():
+# Pin the font so no fallback search runs (every glyph used here is in DejaVu Sans)
+# and turn off mathtext parsing, since none of the labels contain math
+matplotlib.rcParams.update({
+    'font.family': 'DejaVu Sans',
+    'text.parse_math': False,
+    'mathtext.default': 'regular'
+})
+
+# Shared font settings for the repeated box and layer labels
+LABEL_FONT = FontProperties(size=10, weight='bold')
+LAYER_FONT = FontProperties(size=12, weight='bold')
+
+# Resolve the fonts once at import so the first draw doesn't pay for the lookup
+for _font in (FontProperties(family='DejaVu Sans'), LABEL_FONT):
+    findfont(_font)
+
+# Architecture components are stored column-wise (one field per attribute);
+# color/text_color are filled in from 'kind' before drawing
+COMPONENT_DTYPE = np.dtype([
+    ('name', 'U24'), ('x', 'f8'), ('y', 'f8'), ('w', 'f8'), ('h', 'f8'),
+    ('kind', 'U12'), ('label', 'U40'), ('color', 'U7'), ('text_color', 'U5')
+])
+
+# Rendered outputs are cached here, keyed by a hash of the diagram inputs
+CACHE_DIR = Path('.diagram_cache')
+
+def _diagram_cache_key(*inputs):
     """
-    Create a comprehensive architecture diagram for the Bedrock monitoring solution
+    Hash the diagram inputs together with this module's source, so edits to
+    either the data or the drawing code invalidate the cache
+    """
+    digest = hashlib.blake2b(repr(inputs).encode('utf-8'), digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+def _cached_path(cache_key, output):
+    output = Path(output)
+    return CACHE_DIR / f"{output.stem}.{cache_key}{output.suffix}"
+
+def _restore_cached_outputs(cache_key, outputs):
+    """
+    Copy previously rendered files into place; returns False on any cache miss
     """
+    cached = [_cached_path(cache_key, output) for output in outputs]
+    if not all(path.exists() for path in cached):
+        return False
     
-    # Create figure and axis
-    fig, ax = plt.subplots(1, 1, figsize=(20, 14))
-    ax.set_xlim(0, 20)
-    ax.set_ylim(0, 14)
-    ax.axis('off')
+    for path, output in zip(cached, outputs):
+        shutil.copyfile(path, output)
+    return True
+
+def _store_cached_outputs(cache_key, outputs):
+    CACHE_DIR.mkdir(exist_ok=True)
+    for output in outputs:
+        shutil.copyfile(output, _cached_path(cache_key, output))
+
+def _component_array(rows):
+    """
+    Build the component array from (name, x, y, width, height, kind, label) rows;
+    the color fields are left blank to be resolved from 'kind'
+    """
+    components = np.zeros(len(rows), dtype=COMPONENT_DTYPE)
+    for field, values in zip(COMPONENT_DTYPE.names, zip(*rows)):
+        components[field] = values
+    return components
+
+def _arrow_segments(segments, head_length=0.2, head_angle=np.radians(25)):
+    """
+    Expand (N, 2, 2) start/end segments into shafts plus open '->' arrowheads,
+    so all arrows can be drawn as one LineCollection
+    """
+    segments = np.asarray(segments, dtype=float)
+    tips = segments[:, 1]
+    direction = tips - segments[:, 0]
+    angle = np.arctan2(direction[:, 1], direction[:, 0])
     
+    heads = []
+    for offset in (head_angle, -head_angle):
+        barb = np.column_stack((np.cos(angle + offset), np.sin(angle + offset)))
+        heads.append(np.stack((tips - head_length * barb, tips), axis=1))
+    
+    return np.concatenate([segments] + heads)
+
+def lighten(color, alpha, bg=(1, 1, 1)):
+    """
+    Pre-blend color at the given alpha over an opaque background, so artists
+    can be drawn opaque instead of going through Agg's alpha-blend path
+    """
+    r, g, b = mcolors.to_rgb(color)
+    return (alpha*r + (1-alpha)*bg[0], alpha*g + (1-alpha)*bg[1], alpha*b + (1-alpha)*bg[2])
+
+def _prepare_figure(fig, figsize):
+    """
+    Return a blank figure of the given size, reusing fig when one is supplied.
+    The single axis fills the canvas; savefig's bbox_inches='tight' does the
+    cropping, so no tight_layout pass is needed
+    """
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+    else:
+        fig.clear()
+        fig.set_size_inches(figsize)
+    
+    fig.subplots_adjust(left=0, right=1, top=1, bottom=0)
+    return fig
+
+def _connection_segments(components, connections):
+    """
+    Compute (N, 2, 2) start/end points for every connection in one vectorized pass
+    """
+    name_to_idx = {name: i for i, name in enumerate(components['name'])}
+    s = np.array([name_to_idx[start] for start, _ in connections])
+    e = np.array([name_to_idx[end] for _, end in connections])
+    sx, sy, sw, sh = (components[field][s] for field in ('x', 'y', 'w', 'h'))
+    ex, ey, ew, eh = (components[field][e] for field in ('x', 'y', 'w', 'h'))
+    
+    # Calculate connection points: bottom -> top when going down, top -> bottom when going up
+    start_x = sx + sw/2
+    end_x = ex + ew/2
+    going_down = sy > ey + eh
+    start_y = np.where(going_down, sy, sy + sh)
+    end_y = np.where(going_down, ey + eh, ey)
+    
+    # If components are side by side, connect horizontally
+    side_by_side = np.abs(start_y - end_y) < 1
+    going_right = start_x < end_x
+    start_x = np.where(side_by_side, np.where(going_right, sx + sw, sx), start_x)
+    end_x = np.where(side_by_side, np.where(going_right, ex, ex + ew), end_x)
+    start_y = np.where(side_by_side, sy + sh/2, start_y)
+    end_y = np.where(side_by_side, ey + eh/2, end_y)
+    
+    return np.stack((
+        np.column_stack((start_x, start_y)),
+        np.column_stack((end_x, end_y))
+    ), axis=1)
+
+def _svg_text(x, y, text, size, **attrs):
+    """
+    Build a centered, possibly multi-line SVG <text> element (size in points)
+    """
+    lines = text.split('\n')
+    extra = ''.join(f' {name.replace("_", "-")}="{value}"' for name, value in attrs.items())
+    spans = ''.join(
+        f'<tspan x="{x:g}" dy="{-(len(lines) - 1) * 0.6 if i == 0 else 1.2:g}em">{escape(line)}</tspan>'
+        for i, line in enumerate(lines)
+    )
+    return (f'<text x="{x:g}" y="{y:g}" font-size="{size / 72:.4f}" text-anchor="middle" '
+            f'dominant-baseline="central"{extra}>{spans}</text>')
+
+def emit_svg(components, connections, path, colors, layer_labels=(), height=14, width=20):
+    """
+    Write the architecture diagram as a hand-built SVG, without going through matplotlib.
+    Coordinates are in diagram units (1 unit = 1 inch = 72pt), with y flipped for SVG
+    """
+    stroke = 2 / 72
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+        f'width="{width}in" height="{height}in" font-family="DejaVu Sans, sans-serif">',
+        f'<defs><marker id="arrow" viewBox="0 0 10 10" refX="10" refY="5" markerWidth="7" '
+        f'markerHeight="7" orient="auto"><path d="M0,0 L10,5 L0,10" fill="none" '
+        f'stroke="{colors["aws_blue"]}" stroke-width="1.5"/></marker></defs>',
+        f'<rect width="{width}" height="{height}" fill="white"/>',
+        _svg_text(10, height - 13.5, 'AWS Bedrock Enhanced Monitoring & Logging Architecture', 24,
+                  font_weight='bold', fill=colors['aws_blue']),
+        _svg_text(10, height - 13, 'CloudTrail + CloudWatch + Bedrock Native Logging Integration', 14,
+                  font_style='italic', fill=colors['gray']),
+    ]
+    
+    for comp_data in components:
+        x, y, w, h = (float(comp_data[field]) for field in ('x', 'y', 'w', 'h'))
+        parts.append(
+            f'<rect x="{x - 0.1:g}" y="{height - y - h - 0.1:g}" width="{w + 0.2:g}" height="{h + 0.2:g}" '
+            f'rx="0.1" fill="{comp_data["color"]}" fill-opacity="0.8" stroke="{colors["aws_blue"]}" stroke-width="{stroke:.4f}"/>'
+        )
+        parts.append(_svg_text(x + w/2, height - y - h/2, str(comp_data['label']), 10,
+                               font_weight='bold', fill=comp_data['text_color']))
+    
+    for (x1, y1), (x2, y2) in _connection_segments(components, connections):
+        parts.append(
+            f'<line x1="{x1:g}" y1="{height - y1:g}" x2="{x2:g}" y2="{height - y2:g}" '
+            f'stroke="{colors["aws_blue"]}" stroke-opacity="0.7" stroke-width="{stroke:.4f}" '
+            f'marker-end="url(#arrow)"/>'
+        )
+    
+    for layer in layer_labels:
+        x, y = layer['pos']
+        parts.append(_svg_text(x, height - y, layer['text'], 12, font_weight='bold',
+                               fill=layer['color'], transform=f'rotate(-90 {x:g} {height - y:g})'))
+    
+    parts.append('</svg>')
+    Path(path).write_text('\n'.join(parts), encoding='utf-8')
+
+def _architecture_spec():
+    """
+    Define the colors, components, connections and layer labels of the architecture diagram
+    """
     # Define colors
     colors = {
         'aws_orange': '#FF9900',
@@ -31,90 +233,48 @@ def create_architecture_diagram():
         'light_gray': '#F5F5F5'
     }
     
-    # Title
-    ax.text(10, 13.5, 'AWS Bedrock Enhanced Monitoring & Logging Architecture', 
-            fontsize=24, fontweight='bold', ha='center', color=colors['aws_blue'])
-    ax.text(10, 13, 'CloudTrail + CloudWatch + Bedrock Native Logging Integration', 
-            fontsize=14, fontweight='normal', ha='center', color=colors['gray'], style='italic')
-    
-    # Define component positions and sizes
-    components = {
+    # Define component positions and sizes: (name, x, y, width, height, kind, label)
+    components = _component_array([
         # Applications Layer
-        'web_app': {'pos': (1, 11), 'size': (2, 1), 'label': 'Web\nApplications'},
-        'mobile_app': {'pos': (4, 11), 'size': (2, 1), 'label': 'Mobile\nApplications'},
-        'api_clients': {'pos': (7, 11), 'size': (2, 1), 'label': 'API\nClients'},
+        ('web_app', 1, 11, 2, 1, 'app', 'Web\nApplications'),
+        ('mobile_app', 4, 11, 2, 1, 'app', 'Mobile\nApplications'),
+        ('api_clients', 7, 11, 2, 1, 'app', 'API\nClients'),
         
         # AWS Bedrock Services
-        'bedrock_runtime': {'pos': (2, 9), 'size': (3, 1), 'label': 'AWS Bedrock\nRuntime API'},
-        'bedrock_models': {'pos': (6, 9), 'size': (3, 1), 'label': 'Bedrock Foundation\nModels'},
-        'bedrock_logging': {'pos': (10, 9), 'size': (2.5, 1), 'label': 'Bedrock Model\nInvocation Logging'},
+        ('bedrock_runtime', 2, 9, 3, 1, 'bedrock', 'AWS Bedrock\nRuntime API'),
+        ('bedrock_models', 6, 9, 3, 1, 'bedrock', 'Bedrock Foundation\nModels'),
+        ('bedrock_logging', 10, 9, 2.5, 1, 'bedrock', 'Bedrock Model\nInvocation Logging'),
         
         # Monitoring Infrastructure
-        'cloudtrail': {'pos': (0.5, 7), 'size': (2.2, 1), 'label': 'AWS CloudTrail\n(API Logging)'},
-        'cloudwatch': {'pos': (3.2, 7), 'size': (2.2, 1), 'label': 'Amazon CloudWatch\n(Metrics & Logs)'},
-        'bedrock_native_logs': {'pos': (5.9, 7), 'size': (2.2, 1), 'label': 'Bedrock Native\nLogging Config'},
-        'lambda_monitor': {'pos': (8.6, 7), 'size': (2.2, 1), 'label': 'Lambda Functions\n(Custom Metrics)'},
+        ('cloudtrail', 0.5, 7, 2.2, 1, 'aws_service', 'AWS CloudTrail\n(API Logging)'),
+        ('cloudwatch', 3.2, 7, 2.2, 1, 'aws_service', 'Amazon CloudWatch\n(Metrics & Logs)'),
+        ('bedrock_native_logs', 5.9, 7, 2.2, 1, 'bedrock', 'Bedrock Native\nLogging Config'),
+        ('lambda_monitor', 8.6, 7, 2.2, 1, 'aws_service', 'Lambda Functions\n(Custom Metrics)'),
         
         # Storage
-        's3_logs': {'pos': (1, 5), 'size': (2, 1), 'label': 'S3 Bucket\n(Log Storage)'},
-        'log_groups': {'pos': (4, 5), 'size': (2, 1), 'label': 'CloudWatch\nLog Groups'},
-        's3_reports': {'pos': (7, 5), 'size': (2, 1), 'label': 'S3 Bucket\n(Reports)'},
+        ('s3_logs', 1, 5, 2, 1, 'aws_service', 'S3 Bucket\n(Log Storage)'),
+        ('log_groups', 4, 5, 2, 1, 'other', 'CloudWatch\nLog Groups'),
+        ('s3_reports', 7, 5, 2, 1, 'aws_service', 'S3 Bucket\n(Reports)'),
         
         # Analytics & Reporting
-        'log_insights': {'pos': (1, 3), 'size': (2.5, 1), 'label': 'CloudWatch\nLog Insights'},
-        'custom_analytics': {'pos': (4.5, 3), 'size': (2.5, 1), 'label': 'Custom Analytics\n(Python Scripts)'},
-        'automated_reports': {'pos': (8, 3), 'size': (2.5, 1), 'label': 'Automated\nReporting'},
+        ('log_insights', 1, 3, 2.5, 1, 'analytics', 'CloudWatch\nLog Insights'),
+        ('custom_analytics', 4.5, 3, 2.5, 1, 'analytics', 'Custom Analytics\n(Python Scripts)'),
+        ('automated_reports', 8, 3, 2.5, 1, 'other', 'Automated\nReporting'),
         
         # Dashboards
-        'tech_dashboard': {'pos': (12, 9), 'size': (2.5, 1), 'label': 'Technical\nDashboard'},
-        'mgmt_dashboard': {'pos': (15.5, 9), 'size': (2.5, 1), 'label': 'Management\nDashboard'},
-        'security_dashboard': {'pos': (12, 7), 'size': (2.5, 1), 'label': 'Security\nDashboard'},
-        'cost_dashboard': {'pos': (15.5, 7), 'size': (2.5, 1), 'label': 'Cost & Usage\nDashboard'},
+        ('tech_dashboard', 12, 9, 2.5, 1, 'dashboard', 'Technical\nDashboard'),
+        ('mgmt_dashboard', 15.5, 9, 2.5, 1, 'dashboard', 'Management\nDashboard'),
+        ('security_dashboard', 12, 7, 2.5, 1, 'dashboard', 'Security\nDashboard'),
+        ('cost_dashboard', 15.5, 7, 2.5, 1, 'dashboard', 'Cost & Usage\nDashboard'),
         
         # Alerting
-        'sns': {'pos': (12, 5), 'size': (2, 1), 'label': 'Amazon SNS\n(Alerts)'},
-        'ses': {'pos': (15, 5), 'size': (2, 1), 'label': 'Amazon SES\n(Email Reports)'},
+        ('sns', 12, 5, 2, 1, 'aws_service', 'Amazon SNS\n(Alerts)'),
+        ('ses', 15, 5, 2, 1, 'aws_service', 'Amazon SES\n(Email Reports)'),
         
         # External Systems
-        'stakeholders': {'pos': (14, 3), 'size': (3, 1), 'label': 'Stakeholders\n(Email Recipients)'},
-        'eventbridge': {'pos': (11, 3), 'size': (2, 1), 'label': 'EventBridge\n(Scheduling)'}
-    }
-    
-    # Draw components
-    for comp_name, comp_data in components.items():
-        x, y = comp_data['pos']
-        width, height = comp_data['size']
-        label = comp_data['label']
-        
-        # Determine color based on component type
-        if 'bedrock' in comp_name.lower():
-            color = colors['aws_orange']
-        elif any(service in comp_name.lower() for service in ['cloudwatch', 'cloudtrail', 'lambda', 's3', 'sns', 'ses']):
-            color = colors['light_blue']
-        elif 'dashboard' in comp_name.lower():
-            color = colors['green']
-        elif comp_name in ['web_app', 'mobile_app', 'api_clients']:
-            color = colors['purple']
-        elif 'analytics' in comp_name.lower() or 'insights' in comp_name.lower():
-            color = colors['gray']
-        else:
-            color = colors['light_gray']
-        
-        # Draw component box
-        rect = FancyBboxPatch(
-            (x, y), width, height,
-            boxstyle="round,pad=0.1",
-            facecolor=color,
-            edgecolor=colors['aws_blue'],
-            linewidth=2,
-            alpha=0.8
-        )
-        ax.add_patch(rect)
-        
-        # Add label
-        ax.text(x + width/2, y + height/2, label, 
-                ha='center', va='center', fontsize=10, fontweight='bold',
-                color='white' if color in [colors['aws_orange'], colors['aws_blue'], colors['purple']] else 'black')
+        ('stakeholders', 14, 3, 3, 1, 'other', 'Stakeholders\n(Email Recipients)'),
+        ('eventbridge', 11, 3, 2, 1, 'other', 'EventBridge\n(Scheduling)'),
+    ])
     
     # Define connections (arrows)
     connections = [
@@ -164,49 +324,20 @@ def create_architecture_diagram():
         ('eventbridge', 'automated_reports')
     ]
     
-    # Draw connections
-    for start_comp, end_comp in connections:
-        start_pos = components[start_comp]['pos']
-        start_size = components[start_comp]['size']
-        end_pos = components[end_comp]['pos']
-        end_size = components[end_comp]['size']
-        
-        # Calculate connection points
-        start_x = start_pos[0] + start_size[0]/2
-        start_y = start_pos[1]
-        end_x = end_pos[0] + end_size[0]/2
-        end_y = end_pos[1] + end_size[1]
-        
-        # Adjust connection points based on positions
-        if start_y > end_y:  # Arrow going down
-            start_y = start_pos[1]
-            end_y = end_pos[1] + end_size[1]
-        else:  # Arrow going up
-            start_y = start_pos[1] + start_size[1]
-            end_y = end_pos[1]
-        
-        # If components are side by side, connect horizontally
-        if abs(start_y - end_y) < 1:
-            if start_x < end_x:  # Arrow going right
-                start_x = start_pos[0] + start_size[0]
-                start_y = start_pos[1] + start_size[1]/2
-                end_x = end_pos[0]
-                end_y = end_pos[1] + end_size[1]/2
-            else:  # Arrow going left
-                start_x = start_pos[0]
-                start_y = start_pos[1] + start_size[1]/2
-                end_x = end_pos[0] + end_size[0]
-                end_y = end_pos[1] + end_size[1]/2
-        
-        # Draw arrow
-        arrow = patches.FancyArrowPatch(
-            (start_x, start_y), (end_x, end_y),
-            arrowstyle='->', mutation_scale=20,
-            color=colors['aws_blue'], linewidth=2, alpha=0.7
-        )
-        ax.add_patch(arrow)
+    # Resolve fill and label colors once per component from its kind
+    kind_colors = {
+        'bedrock': colors['aws_orange'],
+        'aws_service': colors['light_blue'],
+        'dashboard': colors['green'],
+        'app': colors['purple'],
+        'analytics': colors['gray'],
+        'other': colors['light_gray']
+    }
+    dark_backgrounds = frozenset({colors['aws_orange'], colors['aws_blue'], colors['purple']})
+    components['color'] = [kind_colors[kind] for kind in components['kind']]
+    components['text_color'] = ['white' if color in dark_backgrounds else 'black' for color in components['color']]
     
-    # Add layer labels
+    # Define layer labels
     layer_labels = [
         {'pos': (0.2, 11.5), 'text': 'Application\nLayer', 'color': colors['purple']},
         {'pos': (0.2, 9.5), 'text': 'Bedrock\nServices', 'color': colors['aws_orange']},
@@ -215,22 +346,43 @@ def create_architecture_diagram():
         {'pos': (0.2, 3.5), 'text': 'Analytics &\nReporting', 'color': colors['gray']},
     ]
     
+    return colors, components, connections, layer_labels
+
+def _setup_architecture_axes(fig=None):
+    """
+    Create (or reuse) the figure and a bare axis spanning the 20x14 diagram
+    """
+    fig = _prepare_figure(fig, (20, 14))
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_xlim(0, 20)
+    ax.set_ylim(0, 14)
+    ax.axis('off')
+    ax.set_autoscale_on(False)  # limits are fixed; skip data-limit updates per artist
+    
+    return fig, ax
+
+def _draw_static(ax, colors, layer_labels):
+    """
+    Draw the parts of the architecture diagram that do not depend on the
+    components: title, layer labels, metrics/legend boxes and compliance note
+    """
+    # Title
+    ax.text(10, 13.5, 'AWS Bedrock Enhanced Monitoring & Logging Architecture', 
+            fontsize=24, fontweight='bold', ha='center', color=colors['aws_blue'])
+    ax.text(10, 13, 'CloudTrail + CloudWatch + Bedrock Native Logging Integration', 
+            fontsize=14, fontweight='normal', ha='center', color=colors['gray'], style='italic')
+    
+    # Add layer labels
     for layer in layer_labels:
         ax.text(layer['pos'][0], layer['pos'][1], layer['text'], 
-                fontsize=12, fontweight='bold', ha='left', va='center',
+                fontproperties=LAYER_FONT, ha='left', va='center',
                 color=layer['color'], rotation=90)
     
-    # Add key metrics boxes
-    metrics_box = FancyBboxPatch(
-        (11.5, 11), 7, 1.5,
-        boxstyle="round,pad=0.1",
-        facecolor=colors['light_gray'],
-        edgecolor=colors['aws_blue'],
-        linewidth=2,
-        alpha=0.9
-    )
-    ax.add_patch(metrics_box)
+    # Key metrics and legend panels are drawn as the text's own bbox
+    panel_style = dict(boxstyle="round,pad=0.3", facecolor=lighten(colors['light_gray'], 0.9),
+                       edgecolor=lighten(colors['aws_blue'], 0.9), linewidth=2)
     
+    # Add key metrics box
     metrics_text = """Key Monitoring Metrics:
     • API Invocations & Success Rate  • Token Usage & Cost Analysis
     • Response Times & Performance   • User Behavior & Access Patterns
@@ -238,47 +390,142 @@ def create_architecture_diagram():
     • Native Model Invocation Logs  • Request/Response Payloads"""
     
     ax.text(15, 11.75, metrics_text, ha='center', va='center', fontsize=10,
-            bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
-    
-    # Add data flow legend
-    legend_box = FancyBboxPatch(
-        (11.5, 0.5), 7, 1.5,
-        boxstyle="round,pad=0.1",
-        facecolor=colors['light_gray'],
-        edgecolor=colors['aws_blue'],
-        linewidth=2,
-        alpha=0.9
-    )
-    ax.add_patch(legend_box)
+            bbox=panel_style)
     
+    # Add data flow legend (markers are DejaVu glyphs, not emoji, to avoid font fallback)
     legend_text = """Data Flow Types:
-    🔄 Real-time Metrics    📊 Log Aggregation    📈 Batch Analytics
-    🚨 Alert Notifications  📧 Scheduled Reports  🔍 On-demand Queries"""
+    ▶ Real-time Metrics    ■ Log Aggregation    ● Batch Analytics
+    ▲ Alert Notifications  ◆ Scheduled Reports  ★ On-demand Queries"""
     
     ax.text(15, 1.25, legend_text, ha='center', va='center', fontsize=10,
-            bbox=dict(boxstyle="round,pad=0.3", facecolor='white', alpha=0.8))
+            bbox=panel_style)
     
     # Add compliance note
     ax.text(10, 0.2, 'Architecture follows AWS Well-Architected Framework principles for Security, Reliability, Performance, and Cost Optimization',
             ha='center', va='center', fontsize=10, style='italic', color=colors['aws_blue'])
+
+def _draw_dynamic(ax, components, connections, colors, animated=False):
+    """
+    Draw the component boxes, their labels and the connections.
+    Returns the created artists, box collection first
+    """
+    # Draw components (boxes are batched into a single collection)
+    box_edge = lighten(colors['aws_blue'], 0.8)
+    xs, ys, widths, heights = (components[field] for field in ('x', 'y', 'w', 'h'))
+    boxes = [
+        FancyBboxPatch(
+            (x, y), width, height,
+            boxstyle="round,pad=0.1",
+            facecolor=lighten(color, 0.8),
+            edgecolor=box_edge,
+            linewidth=2
+        )
+        for x, y, width, height, color in zip(xs, ys, widths, heights, components['color'])
+    ]
+    
+    # Add labels
+    labels = [
+        ax.text(x, y, label, 
+                ha='center', va='center', fontproperties=LABEL_FONT,
+                color=text_color, animated=animated)
+        for x, y, label, text_color in zip(xs + widths/2, ys + heights/2, components['label'], components['text_color'])
+    ]
+    
+    box_collection = ax.add_collection(PatchCollection(boxes, match_original=True), autolim=False)
+    box_collection.set_animated(animated)
+    
+    # Draw connections (endpoint geometry computed for all edges at once)
+    segments = _connection_segments(components, connections)
+    
+    # Shafts and arrowheads in a single collection
+    arrows = ax.add_collection(LineCollection(
+        _arrow_segments(segments),
+        colors=[lighten(colors['aws_blue'], 0.7)], linewidths=2, animated=animated
+    ), autolim=False)
+    
+    return [box_collection, arrows] + labels
+
+def open_architecture_editor(fig=None):
+    """
+    Draw the static parts of the architecture diagram once and cache them for
+    blitting while iterating on the layout.
+    Returns (fig, ax, background, (colors, components, connections, layer_labels))
+    """
+    spec = _architecture_spec()
+    colors, _, _, layer_labels = spec
+    fig, ax = _setup_architecture_axes(fig)
+    _draw_static(ax, colors, layer_labels)
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(ax.bbox)
+    
+    return fig, ax, background, spec
+
+def redraw_architecture(fig, ax, background, components, connections, colors, previous=()):
+    """
+    Re-render only the components and connections over the cached static
+    background. Returns the new artists; pass them back as previous next time
+    """
+    for artist in previous:
+        artist.remove()
+    
+    artists = _draw_dynamic(ax, components, connections, colors, animated=True)
+    fig.canvas.restore_region(background)
+    for artist in artists:
+        ax.draw_artist(artist)
+    fig.canvas.blit(ax.bbox)
+    
+    return artists
+
+def create_architecture_diagram(format='png', fig=None, use_cache=True):
+    """
+    Create a comprehensive architecture diagram for the Bedrock monitoring solution
+    
+    format='png' renders PNG + PDF with matplotlib; format='svg' writes a
+    lightweight SVG directly from the component data instead. Pass an existing
+    fig to draw into it (it is cleared and resized) instead of allocating a new one.
+    use_cache=False always draws, even when cached outputs could be restored.
+    Returns the Figure, or None when no matplotlib figure was created
+    """
+    
+    colors, components, connections, layer_labels = _architecture_spec()
+    
+    if format == 'svg':
+        emit_svg(components, connections, 'bedrock_monitoring_architecture.svg', colors, layer_labels)
+        return None
+    
+    # Skip rendering entirely if this exact diagram has already been generated
+    outputs = ['bedrock_monitoring_architecture.png', 'bedrock_monitoring_architecture.pdf']
+    cache_key = _diagram_cache_key(colors, components, connections, layer_labels)
+    if use_cache and _restore_cached_outputs(cache_key, outputs):
+        return None
+    
+    fig, ax = _setup_architecture_axes(fig)
+    _draw_static(ax, colors, layer_labels)
+    box_collection = _draw_dynamic(ax, components, connections, colors)[0]
+    
+    # Flat-colour content does not need 300 dpi; in the PDF only the box fills
+    # are rasterized, text and arrows stay vector (no effect on the PNG)
+    box_collection.set_rasterized(True)
+    box_collection.set_zorder(0)
     
-    plt.tight_layout()
-    plt.savefig('bedrock_monitoring_architecture.png', dpi=300, bbox_inches='tight', 
+    fig.savefig('bedrock_monitoring_architecture.png', dpi=150, bbox_inches='tight',
                 facecolor='white', edgecolor='none')
-    plt.savefig('bedrock_monitoring_architecture.pdf', dpi=300, bbox_inches='tight', 
+    fig.savefig('bedrock_monitoring_architecture.pdf', dpi=200, bbox_inches='tight',
                 facecolor='white', edgecolor='none')
+    _store_cached_outputs(cache_key, outputs)
     
     return fig
 
-def create_data_flow_diagram():
+def create_data_flow_diagram(fig=None, use_cache=True):
     """
     Create a detailed data flow diagram
-    """
-    fig, ax = plt.subplots(1, 1, figsize=(16, 12))
-    ax.set_xlim(0, 16)
-    ax.set_ylim(0, 12)
-    ax.axis('off')
     
+    Pass an existing fig to draw into it (it is cleared and resized) instead
+    of allocating a new one. use_cache=False always draws, even when cached
+    outputs could be restored.
+    
+    Returns the Figure, or None when the output was restored from the cache
+    """
     # Colors
     colors = {
         'data': '#4CAF50',
@@ -287,10 +534,6 @@ def create_data_flow_diagram():
         'output': '#9C27B0'
     }
     
-    # Title
-    ax.text(8, 11.5, 'Bedrock Monitoring Data Flow', 
-            fontsize=20, fontweight='bold', ha='center')
-    
     # Data flow stages
     stages = [
         {'pos': (1, 9), 'size': (2.5, 1.5), 'label': '1. Data Collection\n• API Calls\n• CloudTrail Events\n• Custom Metrics', 'color': colors['data']},
@@ -307,26 +550,7 @@ def create_data_flow_diagram():
         {'pos': (10, 3), 'size': (3, 1.5), 'label': '10. Technical\nReporting\n• Performance Metrics\n• Error Analysis', 'color': colors['output']},
     ]
     
-    # Draw stages
-    for stage in stages:
-        x, y = stage['pos']
-        width, height = stage['size']
-        
-        rect = FancyBboxPatch(
-            (x, y), width, height,
-            boxstyle="round,pad=0.1",
-            facecolor=stage['color'],
-            edgecolor='black',
-            linewidth=2,
-            alpha=0.8
-        )
-        ax.add_patch(rect)
-        
-        ax.text(x + width/2, y + height/2, stage['label'], 
-                ha='center', va='center', fontsize=10, fontweight='bold',
-                color='white')
-    
-    # Draw flow arrows
+    # Flow arrows
     flow_arrows = [
         ((2.25, 9), (5, 9.75)),
         ((7.5, 9.75), (9, 9.75)),
@@ -339,40 +563,95 @@ def create_data_flow_diagram():
         ((11.5, 6), (11.5, 4.5))
     ]
     
-    for start, end in flow_arrows:
-        arrow = patches.FancyArrowPatch(
-            start, end,
-            arrowstyle='->', mutation_scale=20,
-            color='black', linewidth=2
+    # Skip rendering entirely if this exact diagram has already been generated
+    outputs = ['bedrock_data_flow.png']
+    cache_key = _diagram_cache_key(colors, stages, flow_arrows)
+    if use_cache and _restore_cached_outputs(cache_key, outputs):
+        return None
+    
+    # Create figure and axis
+    fig = _prepare_figure(fig, (16, 12))
+    ax = fig.add_subplot(1, 1, 1)
+    ax.set_xlim(0, 16)
+    ax.set_ylim(0, 12)
+    ax.axis('off')
+    ax.set_autoscale_on(False)  # limits are fixed; skip data-limit updates per artist
+    
+    # Title
+    ax.text(8, 11.5, 'Bedrock Monitoring Data Flow', 
+            fontsize=20, fontweight='bold', ha='center')
+    
+    # Draw stages (boxes are batched into a single collection)
+    stage_edge = lighten('black', 0.8)
+    boxes = [
+        FancyBboxPatch(
+            stage['pos'], stage['size'][0], stage['size'][1],
+            boxstyle="round,pad=0.1",
+            facecolor=lighten(stage['color'], 0.8),
+            edgecolor=stage_edge,
+            linewidth=2
         )
-        ax.add_patch(arrow)
+        for stage in stages
+    ]
+    ax.add_collection(PatchCollection(boxes, match_original=True), autolim=False)
+    
+    for stage in stages:
+        x, y = stage['pos']
+        width, height = stage['size']
+        
+        ax.text(x + width/2, y + height/2, stage['label'], 
+                ha='center', va='center', fontproperties=LABEL_FONT,
+                color='white')
+    
+    
+    # Draw flow arrows
+    ax.add_collection(LineCollection(
+        _arrow_segments(flow_arrows),
+        colors='black', linewidths=2
+    ), autolim=False)
     
     # Add timing information
     ax.text(8, 1, 'Data Processing Timeline: Real-time (< 5 min) • Near real-time (5-15 min) • Batch (Daily/Weekly)',
             ha='center', va='center', fontsize=12, style='italic')
     
-    plt.tight_layout()
-    plt.savefig('bedrock_data_flow.png', dpi=300, bbox_inches='tight', 
+    fig.savefig('bedrock_data_flow.png', dpi=150, bbox_inches='tight', 
                 facecolor='white', edgecolor='none')
+    _store_cached_outputs(cache_key, outputs)
     
     return fig
 
+def _render(diagram):
+    """
+    Process-pool entry point: render one diagram without shipping the Figure back
+    """
+    diagram()
+
 if __name__ == "__main__":
     print("Generating architecture diagrams...")
     
-    # Create main architecture diagram
-    arch_fig = create_architecture_diagram()
-    print("✅ Architecture diagram saved as: bedrock_monitoring_architecture.png/.pdf")
+    if INTERACTIVE:
+        # Each diagram needs its own Figure (and a real draw) for plt.show() to display both
+        create_architecture_diagram(use_cache=False)
+        create_data_flow_diagram(use_cache=False)
+    else:
+        # The diagrams are independent and CPU-bound, so render them in parallel processes
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            renders = [
+                executor.submit(_render, create_architecture_diagram),
+                executor.submit(_render, create_data_flow_diagram),
+            ]
+            for render in renders:
+                render.result()
     
-    # Create data flow diagram
-    flow_fig = create_data_flow_diagram()
+    print("✅ Architecture diagram saved as: bedrock_monitoring_architecture.png/.pdf")
     print("✅ Data flow diagram saved as: bedrock_data_flow.png")
     
-    # Show the diagrams
-    plt.show()
+    # Show the diagrams only in an interactive session with a display
+    if INTERACTIVE:
+        plt.show()
     
     print("\n📊 Architecture diagrams generated successfully!")
     print("Files created:")
     print("  - bedrock_monitoring_architecture.png (Main architecture)")
     print("  - bedrock_monitoring_architecture.pdf (PDF version)")
-    print("  - bedrock_data_flow.png (Data flow diagram)")
\ No newline at end of file
+    print("  - bedrock_data_flow.png (Data flow diagram)")
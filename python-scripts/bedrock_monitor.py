@@ -4,13 +4,16 @@ This module provides comprehensive monitoring capabilities for AWS Bedrock servi
 """
 
 import boto3
+from botocore.config import Config
 import json
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-import statistics
-from collections import defaultdict
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
+from collections import Counter, defaultdict
 
 # Configure logging
 logging.basicConfig(
@@ -19,29 +22,181 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Usage metrics fetched by collect_usage_metrics: (query id, metric name, statistic)
+USAGE_METRICS = [
+    ('invocations', 'Invocations', 'Sum'),
+    ('errors', 'Errors', 'Sum'),
+    ('input_tokens', 'InputTokens', 'Sum'),
+    ('output_tokens', 'OutputTokens', 'Sum'),
+    ('duration', 'Duration', 'Average')
+]
+
+# Per-model breakdowns fetched by collect_usage_metrics: (query id, metric name)
+MODEL_METRICS = [
+    ('model_invocations', 'Invocations'),
+    ('model_errors', 'Errors')
+]
+
+# Shared client settings: adaptive retries so throttled calls back off, TCP
+# keep-alive and a connection pool large enough for concurrent requests
+CLIENT_CONFIG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    connect_timeout=3,
+    read_timeout=10
+)
+
+# Maximum MetricDatum entries accepted by a single PutMetricData request
+PUT_METRIC_DATA_BATCH_SIZE = 1000
+
+# Row limit requested for CloudWatch Insights queries (the service maximum)
+INSIGHTS_QUERY_LIMIT = 10000
+
+# Model pricing (tokens per dollar) - these are example rates
+_MODEL_PRICING = {
+    'anthropic.claude-v2': {'input': 0.00001102, 'output': 0.00003268},  # per token
+    'amazon.titan-text-express-v1': {'input': 0.0000008, 'output': 0.0000016},
+    'ai21.j2-ultra-v1': {'input': 0.000015, 'output': 0.000015},
+    'cohere.command-text-v14': {'input': 0.000015, 'output': 0.000015}
+}
+
+# Average pricing across models, used for the simplified cost estimate
+_AVG_INPUT_PRICE = sum(pricing['input'] for pricing in _MODEL_PRICING.values()) / len(_MODEL_PRICING)
+_AVG_OUTPUT_PRICE = sum(pricing['output'] for pricing in _MODEL_PRICING.values()) / len(_MODEL_PRICING)
+
+# Results reused across invocations of a warm Lambda container, keyed by
+# (region, UTC day) and refreshed once older than CACHE_TTL_SECONDS
+CACHE_TTL_SECONDS = 6 * 3600
+_MODELS_CACHE: Dict[Tuple[str, str], Tuple[List[Dict[str, Any]], float]] = {}
+_BASELINE_CACHE: Dict[Tuple[str, str], Tuple[Dict[str, float], float]] = {}
+
+def _cache_get(cache: Dict[Tuple[str, str], Tuple[Any, float]], region_name: str) -> Optional[Any]:
+    """
+    Return today's cached value for a region if it is younger than CACHE_TTL_SECONDS
+    """
+    entry = cache.get((region_name, datetime.utcnow().date().isoformat()))
+    if entry and time.time() - entry[1] < CACHE_TTL_SECONDS:
+        return entry[0]
+    return None
+
+def _cache_put(cache: Dict[Tuple[str, str], Tuple[Any, float]], region_name: str, value: Any) -> None:
+    """
+    Store a value for a region under today's key
+    """
+    cache[(region_name, datetime.utcnow().date().isoformat())] = (value, time.time())
+
+def _epoch(value: datetime) -> float:
+    """
+    Convert a datetime to epoch seconds, treating naive values as UTC
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+def _align(value: datetime, period: int) -> datetime:
+    """
+    Round a datetime down to the nearest multiple of a period
+    
+    Args:
+        value: Datetime to align (naive values are treated as UTC)
+        period: Period length in seconds
+        
+    Returns:
+        Aligned datetime with the same tzinfo as the input
+    """
+    return value.replace(microsecond=0) - timedelta(seconds=int(_epoch(value)) % period)
+
+def _mean_stdev(values) -> Tuple[float, float]:
+    """
+    Compute mean and sample standard deviation in a single pass (Welford's algorithm)
+    
+    Args:
+        values: Iterable of numbers
+        
+    Returns:
+        Tuple of (mean, sample standard deviation); the deviation is 0 for fewer
+        than two values
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for value in values:
+        count += 1
+        delta = value - mean
+        mean += delta / count
+        m2 += delta * (value - mean)
+    
+    return mean, (m2 / (count - 1)) ** 0.5 if count > 1 else 0.0
+
 class BedrockMonitor:
     """
     Main class for monitoring AWS Bedrock services
     """
     
-    def __init__(self, region_name: str = 'us-east-1'):
+    def __init__(self, region_name: str = 'us-east-1', session: Optional[boto3.Session] = None):
         """
         Initialize the Bedrock monitor
         
         Args:
             region_name: AWS region to monitor
+            session: Existing boto3 session to share credentials with (optional)
         """
         self.region_name = region_name
-        self.bedrock_client = boto3.client('bedrock', region_name=region_name)
-        self.bedrock_runtime_client = boto3.client('bedrock-runtime', region_name=region_name)
-        self.cloudwatch_client = boto3.client('cloudwatch', region_name=region_name)
-        self.logs_client = boto3.client('logs', region_name=region_name)
-        self.sns_client = boto3.client('sns', region_name=region_name)
+        self.session = session or boto3.Session(region_name=region_name)
+        
+        # Clients are created on first use (see _client) to keep cold starts short
+        self._clients: Dict[str, Any] = {}
+        self._clients_lock = threading.Lock()
         
         # Environment variables
         self.environment = os.getenv('ENVIRONMENT', 'prod')
         self.sns_topic_arn = os.getenv('SNS_TOPIC_ARN')
         
+        # Dimensions shared by every published custom metric
+        self._default_dims = [{'Name': 'Environment', 'Value': self.environment}]
+        
+    def _client(self, service_name: str):
+        """
+        Get the client for a service, creating it on first use
+        
+        Creation is serialized because boto3 sessions are not thread-safe.
+        
+        Args:
+            service_name: AWS service name (e.g. 'cloudwatch')
+            
+        Returns:
+            boto3 client for the service
+        """
+        client = self._clients.get(service_name)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(service_name)
+                if client is None:
+                    client = self.session.client(service_name, config=CLIENT_CONFIG)
+                    self._clients[service_name] = client
+        return client
+    
+    @property
+    def bedrock_client(self):
+        return self._client('bedrock')
+    
+    @property
+    def bedrock_runtime_client(self):
+        return self._client('bedrock-runtime')
+    
+    @property
+    def cloudwatch_client(self):
+        return self._client('cloudwatch')
+    
+    @property
+    def logs_client(self):
+        return self._client('logs')
+    
+    @property
+    def sns_client(self):
+        return self._client('sns')
+    
     def get_available_models(self) -> List[Dict[str, Any]]:
         """
         Get list of available Bedrock models
@@ -49,9 +204,15 @@ class BedrockMonitor:
         Returns:
             List of available models with their details
         """
+        models = _cache_get(_MODELS_CACHE, self.region_name)
+        if models is not None:
+            return models
+        
         try:
             response = self.bedrock_client.list_foundation_models()
-            return response.get('modelSummaries', [])
+            models = response.get('modelSummaries', [])
+            _cache_put(_MODELS_CACHE, self.region_name, models)
+            return models
         except Exception as e:
             logger.error(f"Error fetching available models: {str(e)}")
             return []
@@ -78,36 +239,42 @@ class BedrockMonitor:
             'hourly_usage': defaultdict(int)
         }
         
+        # Align to the 5 minute query period so CloudWatch returns whole buckets
+        start_time = _align(start_time, 300)
+        end_time = _align(end_time, 300)
+        
         try:
-            # Get invocation metrics
-            invocations = self._get_cloudwatch_metric(
-                'AWS/Bedrock', 'Invocations', start_time, end_time, 'Sum'
-            )
-            metrics['total_invocations'] = sum(point['Sum'] for point in invocations)
-            
-            # Get error metrics
-            errors = self._get_cloudwatch_metric(
-                'AWS/Bedrock', 'Errors', start_time, end_time, 'Sum'
-            )
-            metrics['total_errors'] = sum(point['Sum'] for point in errors)
-            
-            # Get token metrics
-            input_tokens = self._get_cloudwatch_metric(
-                'AWS/Bedrock', 'InputTokens', start_time, end_time, 'Sum'
-            )
-            metrics['total_input_tokens'] = sum(point['Sum'] for point in input_tokens)
-            
-            output_tokens = self._get_cloudwatch_metric(
-                'AWS/Bedrock', 'OutputTokens', start_time, end_time, 'Sum'
-            )
-            metrics['total_output_tokens'] = sum(point['Sum'] for point in output_tokens)
-            
-            # Get duration metrics
-            duration = self._get_cloudwatch_metric(
-                'AWS/Bedrock', 'Duration', start_time, end_time, 'Average'
-            )
-            if duration:
-                metrics['avg_duration'] = statistics.mean(point['Average'] for point in duration)
+            # Fetch all usage metrics, plus per-model invocations and errors, in a
+            # single GetMetricData request
+            queries = [self._metric_query(query_id, metric_name, stat) for query_id, metric_name, stat in USAGE_METRICS]
+            queries.extend(self._model_search_query(query_id, metric_name) for query_id, metric_name in MODEL_METRICS)
+            
+            values = defaultdict(list)
+            hourly_invocations = defaultdict(float)
+            for result in self._iter_metric_data_results(queries, start_time, end_time):
+                query_id = result['Id']
+                if query_id == 'model_invocations':
+                    metrics['model_usage'][result['Label']] += sum(result.get('Values', []))
+                elif query_id == 'model_errors':
+                    metrics['error_distribution'][result['Label']] += sum(result.get('Values', []))
+                else:
+                    values[query_id].extend(result.get('Values', []))
+                    if query_id == 'invocations':
+                        for timestamp, value in zip(result.get('Timestamps', []), result.get('Values', [])):
+                            ts = int(timestamp.timestamp())
+                            hourly_invocations[ts - ts % 3600] += value
+            
+            # Convert hour buckets back to datetimes once per hour, not per datapoint
+            for hour_ts in sorted(hourly_invocations):
+                hour = datetime.fromtimestamp(hour_ts, tz=timezone.utc)
+                metrics['hourly_usage'][hour.isoformat()] += hourly_invocations[hour_ts]
+            
+            metrics['total_invocations'] = sum(values['invocations'])
+            metrics['total_errors'] = sum(values['errors'])
+            metrics['total_input_tokens'] = sum(values['input_tokens'])
+            metrics['total_output_tokens'] = sum(values['output_tokens'])
+            if values['duration']:
+                metrics['avg_duration'] = sum(values['duration']) / len(values['duration'])
             
             # Calculate success rate
             if metrics['total_invocations'] > 0:
@@ -123,40 +290,145 @@ class BedrockMonitor:
             
         return metrics
     
-    def _get_cloudwatch_metric(
-        self, 
-        namespace: str, 
+    @staticmethod
+    def _metric_query(
+        query_id: str, 
         metric_name: str, 
-        start_time: datetime, 
-        end_time: datetime, 
-        statistic: str
-    ) -> List[Dict[str, Any]]:
+        statistic: str, 
+        period: int = 300,
+        namespace: str = 'AWS/Bedrock'
+    ) -> Dict[str, Any]:
         """
-        Get CloudWatch metric data
+        Build a GetMetricData query entry
         
         Args:
-            namespace: CloudWatch namespace
+            query_id: Identifier of the query in the response (must start with a lowercase letter)
             metric_name: Name of the metric
+            statistic: Statistic to retrieve (Sum, Average, etc.)
+            period: Aggregation period in seconds
+            namespace: CloudWatch namespace
+            
+        Returns:
+            MetricDataQuery dictionary
+        """
+        return {
+            'Id': query_id,
+            'MetricStat': {
+                'Metric': {'Namespace': namespace, 'MetricName': metric_name},
+                'Period': period,
+                'Stat': statistic
+            },
+            'ReturnData': True
+        }
+    
+    @staticmethod
+    def _model_search_query(query_id: str, metric_name: str, period: int = 300) -> Dict[str, Any]:
+        """
+        Build a GetMetricData SEARCH query returning one Sum series per ModelId
+        
+        Args:
+            query_id: Identifier of the query in the response
+            metric_name: Name of the AWS/Bedrock metric
+            period: Aggregation period in seconds
+            
+        Returns:
+            MetricDataQuery dictionary whose results are labelled with the model ID
+        """
+        return {
+            'Id': query_id,
+            'Expression': f"SEARCH('{{AWS/Bedrock,ModelId}} MetricName=\"{metric_name}\"', 'Sum', {period})",
+            'Label': "${PROP('Dim.ModelId')}",
+            'ReturnData': True
+        }
+    
+    def _iter_metric_data_results(
+        self, 
+        queries: List[Dict[str, Any]], 
+        start_time: datetime, 
+        end_time: datetime
+    ):
+        """
+        Run one GetMetricData request and yield its MetricDataResults across all pages
+        
+        Args:
+            queries: MetricDataQuery entries (up to 500 per request)
             start_time: Start time for metrics
             end_time: End time for metrics
-            statistic: Statistic to retrieve (Sum, Average, etc.)
+            
+        Yields:
+            MetricDataResult dictionaries (Id, Label, Timestamps, Values)
+        """
+        paginator = self.cloudwatch_client.get_paginator('get_metric_data')
+        pages = paginator.paginate(
+            MetricDataQueries=queries,
+            StartTime=start_time,
+            EndTime=end_time,
+            ScanBy='TimestampDescending'
+        )
+        
+        for page in pages:
+            yield from page.get('MetricDataResults', [])
+    
+    def get_daily_counts(
+        self, 
+        start_time: datetime, 
+        end_time: datetime, 
+        metric_names: List[str]
+    ) -> Dict[str, List[float]]:
+        """
+        Get daily Sum series for several metrics with a single GetMetricData call
+        
+        Args:
+            start_time: Start of the window (rounded down to UTC midnight)
+            end_time: End of the window
+            metric_names: Names of the AWS/Bedrock metrics to retrieve
             
         Returns:
-            List of metric data points
+            Dictionary mapping each metric name to one value per day, oldest first;
+            days without datapoints are 0
         """
-        try:
-            response = self.cloudwatch_client.get_metric_statistics(
-                Namespace=namespace,
-                MetricName=metric_name,
-                StartTime=start_time,
-                EndTime=end_time,
-                Period=300,  # 5 minutes
-                Statistics=[statistic]
-            )
-            return response.get('Datapoints', [])
-        except Exception as e:
-            logger.error(f"Error getting CloudWatch metric {metric_name}: {str(e)}")
-            return []
+        return self._get_sum_series(start_time, end_time, metric_names, 86400)
+    
+    def _get_sum_series(
+        self, 
+        start_time: datetime, 
+        end_time: datetime, 
+        metric_names: List[str], 
+        period: int = 3600
+    ) -> Dict[str, List[float]]:
+        """
+        Get Sum series for several metrics with a single GetMetricData call
+        
+        Args:
+            start_time: Start of the window (rounded down to the period)
+            end_time: End of the window
+            metric_names: Names of the AWS/Bedrock metrics to retrieve
+            period: Bucket length in seconds
+            
+        Returns:
+            Dictionary mapping each metric name to one value per period, aligned across
+            metrics; periods without datapoints are 0
+        """
+        # Bucket with integer epoch seconds; datetimes are only needed for the request
+        start_time = _align(start_time, period)
+        start_ts = int(_epoch(start_time))
+        buckets = max(0, -(-(int(_epoch(end_time)) - start_ts) // period))
+        series = {name: [0.0] * buckets for name in metric_names}
+        
+        queries = [
+            self._metric_query(f'm{i}', name, 'Sum', period=period)
+            for i, name in enumerate(metric_names)
+        ]
+        
+        # Errors propagate so callers never cache a partially filled series
+        for result in self._iter_metric_data_results(queries, start_time, end_time):
+            values = series[metric_names[int(result['Id'][1:])]]
+            for timestamp, value in zip(result.get('Timestamps', []), result.get('Values', [])):
+                bucket = (int(timestamp.timestamp()) - start_ts) // period
+                if 0 <= bucket < buckets:
+                    values[bucket] += value
+        
+        return series
     
     def analyze_user_behavior(self, hours_back: int = 24) -> Dict[str, Any]:
         """
@@ -173,49 +445,71 @@ class BedrockMonitor:
         
         log_group_name = f'/aws/bedrock/application-logs/{self.environment}'
         
-        query = """
+        # Totals per user/model and the hourly histogram are separate queries: binning the
+        # totals by hour would multiply the row count and truncate the low-count rows
+        totals_query = """
         fields @timestamp, userIdentity.userName, eventName, sourceIPAddress, requestParameters.modelId
         | filter eventName like /Bedrock/
         | stats count() as requestCount by userIdentity.userName, requestParameters.modelId
         | sort requestCount desc
         """
+        hourly_query = """
+        fields @timestamp
+        | filter eventName like /Bedrock/
+        | stats count() as requestCount by bin(1h) as hour
+        """
         
         try:
-            # Start CloudWatch Insights query
-            response = self.logs_client.start_query(
-                logGroupName=log_group_name,
-                startTime=int(start_time.timestamp()),
-                endTime=int(end_time.timestamp()),
-                queryString=query
-            )
-            
-            query_id = response['queryId']
-            
-            # Wait for query completion and get results
-            import time
-            while True:
-                time.sleep(2)
-                result = self.logs_client.get_query_results(queryId=query_id)
-                if result['status'] == 'Complete':
-                    break
-                elif result['status'] == 'Failed':
-                    logger.error("CloudWatch Insights query failed")
+            # Start both CloudWatch Insights queries so they run concurrently
+            query_ids = [
+                self.logs_client.start_query(
+                    logGroupName=log_group_name,
+                    startTime=int(start_time.timestamp()),
+                    endTime=int(end_time.timestamp()),
+                    queryString=query,
+                    limit=INSIGHTS_QUERY_LIMIT
+                )['queryId']
+                for query in (totals_query, hourly_query)
+            ]
+            
+            # Wait for each query to complete, then fetch its results once
+            results = []
+            for query_id in query_ids:
+                status = self._wait_for_query(query_id, log_group_name)
+                if status != 'Complete':
+                    logger.error(f"CloudWatch Insights query {status.lower()}")
                     return {}
+                rows = self.logs_client.get_query_results(queryId=query_id)['results']
+                if len(rows) >= INSIGHTS_QUERY_LIMIT:
+                    logger.warning(f"CloudWatch Insights query {query_id} hit the {INSIGHTS_QUERY_LIMIT} row limit; results are truncated")
+                results.append(rows)
+            totals_rows, hourly_rows = results
             
             # Process results
             user_behavior = {
                 'top_users': [],
-                'model_preferences': defaultdict(int),
+                'model_preferences': Counter(),
                 'unique_users': set(),
-                'total_requests': 0
+                'total_requests': 0,
+                'hourly_usage': defaultdict(int)
             }
             
-            for result_row in result['results']:
-                row_data = {item['field']: item['value'] for item in result_row}
-                user_behavior['top_users'].append(row_data)
-                user_behavior['unique_users'].add(row_data.get('userIdentity.userName', 'unknown'))
-                user_behavior['model_preferences'][row_data.get('requestParameters.modelId', 'unknown')] += int(row_data.get('requestCount', 0))
-                user_behavior['total_requests'] += int(row_data.get('requestCount', 0))
+            for user, model_id, request_count in self._read_rows(
+                totals_rows, ['userIdentity.userName', 'requestParameters.modelId', 'requestCount']
+            ):
+                request_count = int(request_count or 0)
+                user_behavior['top_users'].append({
+                    'userIdentity.userName': user,
+                    'requestParameters.modelId': model_id,
+                    'requestCount': str(request_count)
+                })
+                user_behavior['unique_users'].add(user or 'unknown')
+                user_behavior['model_preferences'][model_id or 'unknown'] += request_count
+                user_behavior['total_requests'] += request_count
+            
+            for hour, request_count in self._read_rows(hourly_rows, ['hour', 'requestCount']):
+                if hour:
+                    user_behavior['hourly_usage'][hour] += int(request_count or 0)
             
             user_behavior['unique_users'] = len(user_behavior['unique_users'])
             
@@ -225,6 +519,124 @@ class BedrockMonitor:
             logger.error(f"Error analyzing user behavior: {str(e)}")
             return {}
     
+    @staticmethod
+    def _read_rows(rows: List[List[Dict[str, str]]], names: List[str]):
+        """
+        Yield the values of the named fields from CloudWatch Insights result rows
+        
+        Field order is the same for every row of a stats query, so column positions
+        are resolved once (from the widest row) and values are read positionally.
+        """
+        fields = [item['field'] for item in max(rows, key=len)] if rows else []
+        indexes = [fields.index(name) if name in fields else None for name in names]
+        
+        for result_row in rows:
+            if len(result_row) != len(fields):
+                # Row with missing (null) fields: realign it by field name
+                row_by_field = {item['field']: item['value'] for item in result_row}
+                row = [row_by_field.get(field) for field in fields]
+            else:
+                row = [item['value'] for item in result_row]
+            
+            yield [row[index] if index is not None else None for index in indexes]
+    
+    def _wait_for_query(
+        self, 
+        query_id: str, 
+        log_group_name: str, 
+        initial_delay: float = 0.1, 
+        max_delay: float = 2.0,
+        max_wait: float = 60.0
+    ) -> str:
+        """
+        Poll a CloudWatch Insights query with DescribeQueries until it finishes
+        
+        Polling uses exponential backoff so short queries return quickly without
+        spending the GetQueryResults request quota on status checks. A query missing
+        from the DescribeQueries page falls back to GetQueryResults for its status.
+        
+        Args:
+            query_id: ID returned by start_query
+            log_group_name: Log group the query runs against
+            initial_delay: First polling delay in seconds
+            max_delay: Upper bound for the polling delay in seconds
+            max_wait: Give up (returning Timeout) after this many seconds
+            
+        Returns:
+            Final query status (Complete, Failed, Cancelled, Timeout or Unknown)
+        """
+        deadline = time.monotonic() + max_wait
+        delay = initial_delay
+        while True:
+            response = self.logs_client.describe_queries(logGroupName=log_group_name)
+            status = next(
+                (q['status'] for q in response.get('queries', []) if q['queryId'] == query_id),
+                None
+            )
+            if status is None:
+                status = self.logs_client.get_query_results(queryId=query_id).get('status', 'Unknown')
+            if status not in ('Scheduled', 'Running'):
+                return status
+            
+            if time.monotonic() + delay > deadline:
+                return 'Timeout'
+            time.sleep(delay)
+            delay = min(delay * 1.5, max_delay)
+    
+    def _get_baseline_stats(self, current_hour_start: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Get 7-day hourly baseline statistics for invocations and error rate
+        
+        Statistics are cached per region and day, so warm Lambda containers skip
+        the baseline fetch until the cached entry is CACHE_TTL_SECONDS old.
+        
+        Args:
+            current_hour_start: Start of the current hour; the baseline ends here
+            
+        Returns:
+            Dictionary with per hour-of-day (UTC) mean/stdev of invocations and the
+            mean/stdev of hourly error rates, or None if there is not enough data
+        """
+        baseline = _cache_get(_BASELINE_CACHE, self.region_name)
+        if baseline is not None:
+            return baseline
+        
+        # Get the last 7 days of hourly data for the baseline, aligned to hour boundaries
+        # (one bulk request instead of one request per hour)
+        start_time = current_hour_start - timedelta(days=7)
+        series = self._get_sum_series(start_time, current_hour_start, ['Invocations', 'Errors'], 3600)
+        baseline_metrics = series['Invocations']
+        
+        if len(baseline_metrics) < 24:  # Need at least 24 hours of data
+            return None
+        
+        # Calculate baseline error rates from the same hourly series
+        baseline_error_rates = [
+            (errors / invocations) * 100
+            for invocations, errors in zip(series['Invocations'], series['Errors'])
+            if invocations > 0
+        ]
+        
+        # Seasonal baseline: statistics per hour of day, so quiet night hours are
+        # not compared against busy daytime traffic
+        hourly_mean = []
+        hourly_stdev = []
+        for hour in range(24):
+            mean, stdev = _mean_stdev(baseline_metrics[(hour - start_time.hour) % 24::24])
+            hourly_mean.append(mean)
+            hourly_stdev.append(stdev)
+        
+        error_mean, error_stdev = _mean_stdev(baseline_error_rates)
+        baseline = {
+            'hourly_mean': hourly_mean,
+            'hourly_stdev': hourly_stdev,
+            'error_mean': error_mean if baseline_error_rates else None,
+            'error_stdev': error_stdev
+        }
+        _cache_put(_BASELINE_CACHE, self.region_name, baseline)
+        
+        return baseline
+    
     def detect_anomalies(self, threshold_multiplier: float = 2.0) -> List[Dict[str, Any]]:
         """
         Detect anomalies in Bedrock usage patterns
@@ -238,30 +650,19 @@ class BedrockMonitor:
         anomalies = []
         
         try:
-            # Get last 7 days of data for baseline
-            end_time = datetime.utcnow()
-            start_time = end_time - timedelta(days=7)
-            
-            # Collect baseline metrics
-            baseline_metrics = []
-            current_time = start_time
-            while current_time < end_time:
-                next_time = current_time + timedelta(hours=1)
-                hourly_metrics = self.collect_usage_metrics(current_time, next_time)
-                baseline_metrics.append(hourly_metrics['total_invocations'])
-                current_time = next_time
-            
-            if len(baseline_metrics) < 24:  # Need at least 24 hours of data
+            current_hour_start = _align(datetime.utcnow(), 3600)
+            baseline = self._get_baseline_stats(current_hour_start)
+            if baseline is None:
                 logger.warning("Insufficient data for anomaly detection")
                 return anomalies
             
-            # Calculate baseline statistics
-            baseline_mean = statistics.mean(baseline_metrics)
-            baseline_stdev = statistics.stdev(baseline_metrics)
+            # Compare against the same hour of day; the stdev floor of 1 keeps
+            # near-constant hours from flagging every small change
+            baseline_mean = baseline['hourly_mean'][current_hour_start.hour]
+            baseline_stdev = max(baseline['hourly_stdev'][current_hour_start.hour], 1)
             threshold = baseline_mean + (threshold_multiplier * baseline_stdev)
             
             # Check current hour against baseline
-            current_hour_start = datetime.utcnow().replace(minute=0, second=0, microsecond=0)
             current_hour_end = current_hour_start + timedelta(hours=1)
             current_metrics = self.collect_usage_metrics(current_hour_start, current_hour_end)
             
@@ -271,6 +672,7 @@ class BedrockMonitor:
                     'current_value': current_metrics['total_invocations'],
                     'threshold': threshold,
                     'baseline_mean': baseline_mean,
+                    'z_score': (current_metrics['total_invocations'] - baseline_mean) / baseline_stdev,
                     'timestamp': current_hour_start.isoformat(),
                     'severity': 'high' if current_metrics['total_invocations'] > threshold * 1.5 else 'medium'
                 })
@@ -278,21 +680,10 @@ class BedrockMonitor:
             # Check error rate anomalies
             if current_metrics['total_invocations'] > 0:
                 current_error_rate = (current_metrics['total_errors'] / current_metrics['total_invocations']) * 100
-                baseline_error_rates = []
                 
-                # Calculate baseline error rates
-                current_time = start_time
-                while current_time < end_time - timedelta(hours=1):
-                    next_time = current_time + timedelta(hours=1)
-                    hourly_metrics = self.collect_usage_metrics(current_time, next_time)
-                    if hourly_metrics['total_invocations'] > 0:
-                        error_rate = (hourly_metrics['total_errors'] / hourly_metrics['total_invocations']) * 100
-                        baseline_error_rates.append(error_rate)
-                    current_time = next_time
-                
-                if baseline_error_rates:
-                    baseline_error_mean = statistics.mean(baseline_error_rates)
-                    baseline_error_stdev = statistics.stdev(baseline_error_rates) if len(baseline_error_rates) > 1 else 0
+                if baseline['error_mean'] is not None:
+                    baseline_error_mean = baseline['error_mean']
+                    baseline_error_stdev = baseline['error_stdev']
                     error_threshold = baseline_error_mean + (threshold_multiplier * baseline_error_stdev)
                     
                     if current_error_rate > error_threshold and current_error_rate > 5:  # At least 5% error rate
@@ -310,6 +701,20 @@ class BedrockMonitor:
         
         return anomalies
     
+    @staticmethod
+    def estimate_token_cost(input_tokens, output_tokens):
+        """
+        Estimate input and output token cost assuming average model pricing
+        
+        Args:
+            input_tokens: Input token count (a number or an array of daily counts)
+            output_tokens: Output token count (a number or an array of daily counts)
+            
+        Returns:
+            Tuple of (input cost, output cost) in the same shape as the inputs
+        """
+        return input_tokens * _AVG_INPUT_PRICE, output_tokens * _AVG_OUTPUT_PRICE
+    
     def generate_cost_analysis(self, days_back: int = 30) -> Dict[str, Any]:
         """
         Generate cost analysis based on token usage
@@ -320,14 +725,6 @@ class BedrockMonitor:
         Returns:
             Dictionary containing cost analysis
         """
-        # Model pricing (tokens per dollar) - these are example rates
-        model_pricing = {
-            'anthropic.claude-v2': {'input': 0.00001102, 'output': 0.00003268},  # per token
-            'amazon.titan-text-express-v1': {'input': 0.0000008, 'output': 0.0000016},
-            'ai21.j2-ultra-v1': {'input': 0.000015, 'output': 0.000015},
-            'cohere.command-text-v14': {'input': 0.000015, 'output': 0.000015}
-        }
-        
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(days=days_back)
         
@@ -348,12 +745,9 @@ class BedrockMonitor:
             cost_analysis['token_usage']['output_tokens'] = metrics['total_output_tokens']
             
             # Calculate estimated costs (simplified - would need more detailed breakdown by model)
-            # This is a simplified calculation assuming average model pricing
-            avg_input_price = statistics.mean([pricing['input'] for pricing in model_pricing.values()])
-            avg_output_price = statistics.mean([pricing['output'] for pricing in model_pricing.values()])
-            
-            input_cost = metrics['total_input_tokens'] * avg_input_price
-            output_cost = metrics['total_output_tokens'] * avg_output_price
+            input_cost, output_cost = self.estimate_token_cost(
+                metrics['total_input_tokens'], metrics['total_output_tokens']
+            )
             
             cost_analysis['total_estimated_cost'] = input_cost + output_cost
             cost_analysis['input_token_cost'] = input_cost
@@ -411,21 +805,20 @@ class BedrockMonitor:
                         'MetricName': metric_name,
                         'Value': value,
                         'Unit': 'Count',
-                        'Dimensions': [
-                            {
-                                'Name': 'Environment',
-                                'Value': self.environment
-                            }
-                        ]
+                        'Dimensions': self._default_dims
                     })
             
-            # Publish metrics in batches of 20 (CloudWatch limit)
-            for i in range(0, len(metric_data), 20):
-                batch = metric_data[i:i+20]
-                self.cloudwatch_client.put_metric_data(
-                    Namespace='Custom/Bedrock',
-                    MetricData=batch
-                )
+            # Publish metrics in batches of up to 1000 (CloudWatch limit); batches are
+            # independent, so send them concurrently over the shared client
+            batches = [
+                metric_data[i:i+PUT_METRIC_DATA_BATCH_SIZE]
+                for i in range(0, len(metric_data), PUT_METRIC_DATA_BATCH_SIZE)
+            ]
+            if len(batches) == 1:
+                self._put_metric_batch(batches[0])
+            elif batches:
+                with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+                    list(executor.map(self._put_metric_batch, batches))
             
             logger.info(f"Published {len(metric_data)} custom metrics to CloudWatch")
             return True
@@ -434,6 +827,18 @@ class BedrockMonitor:
             logger.error(f"Error publishing custom metrics: {str(e)}")
             return False
 
+    def _put_metric_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Publish one batch of custom metric data to CloudWatch
+        
+        Args:
+            batch: MetricDatum entries (at most PUT_METRIC_DATA_BATCH_SIZE)
+        """
+        self.cloudwatch_client.put_metric_data(
+            Namespace='Custom/Bedrock',
+            MetricData=batch
+        )
+
 def lambda_handler(event, context):
     """
     AWS Lambda handler for scheduled monitoring
@@ -441,27 +846,34 @@ def lambda_handler(event, context):
     try:
         monitor = BedrockMonitor()
         
-        # Collect current metrics
+        # Metric collection, anomaly detection and user behavior analysis are
+        # independent network-bound calls, so run them concurrently
         end_time = datetime.utcnow()
         start_time = end_time - timedelta(hours=1)
-        metrics = monitor.collect_usage_metrics(start_time, end_time)
-        
-        # Publish custom metrics
-        monitor.publish_custom_metrics(metrics)
-        
-        # Check for anomalies
-        anomalies = monitor.detect_anomalies()
-        
-        if anomalies:
-            alert_message = f"Detected {len(anomalies)} anomalies in Bedrock usage:\n\n"
-            for anomaly in anomalies:
-                alert_message += f"- {anomaly['type']}: Current value {anomaly['current_value']}, "
-                alert_message += f"Threshold: {anomaly['threshold']:.2f}, Severity: {anomaly['severity']}\n"
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            metrics_future = executor.submit(monitor.collect_usage_metrics, start_time, end_time)
+            anomalies_future = executor.submit(monitor.detect_anomalies)
+            user_behavior_future = executor.submit(monitor.analyze_user_behavior)
+            
+            # Publish custom metrics
+            metrics = metrics_future.result()
+            monitor.publish_custom_metrics(metrics)
+            
+            # Check for anomalies
+            anomalies = anomalies_future.result()
+            if anomalies:
+                alert_lines = [f"Detected {len(anomalies)} anomalies in Bedrock usage:\n\n"]
+                for anomaly in anomalies:
+                    alert_lines.append(
+                        f"- {anomaly['type']}: Current value {anomaly['current_value']}, "
+                        f"Threshold: {anomaly['threshold']:.2f}, Severity: {anomaly['severity']}\n"
+                    )
+                alert_message = ''.join(alert_lines)
+                
+                monitor.send_alert(alert_message, "Bedrock Usage Anomaly Detected")
             
-            monitor.send_alert(alert_message, "Bedrock Usage Anomaly Detected")
-        
-        # Analyze user behavior
-        user_behavior = monitor.analyze_user_behavior()
+            # Analyze user behavior
+            user_behavior = user_behavior_future.result()
         
         response = {
             'statusCode': 200,
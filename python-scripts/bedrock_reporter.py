@@ -4,17 +4,214 @@ Generates comprehensive reports for management and technical teams
 """
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+import gzip
+import hashlib
 import json
 import os
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, List, Any
-import pandas as pd
-from jinja2 import Template
-import matplotlib.pyplot as plt
-import seaborn as sns
+from typing import Dict, List, Any, Tuple, TYPE_CHECKING
+import numpy as np
+from jinja2 import Environment
 from io import BytesIO
+from pathlib import Path
 import base64
-from bedrock_monitor import BedrockMonitor
+from bedrock_monitor import BedrockMonitor, CLIENT_CONFIG
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the standard library json module
+
+# matplotlib is imported lazily in _create_charts; summaries never need it
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+# Resolution of report charts (emailed and inlined in HTML, so kept modest)
+CHART_DPI = 100
+
+# Fixed chart palettes: the first five Set3 colours for the model pie, tab10 blue/orange/red elsewhere
+_MODEL_COLORS = ['#8dd3c7', '#ffffb3', '#bebada', '#fb8072', '#80b1d3']
+_COST_COLORS = ['#1f77b4', '#ff7f0e']
+_ERROR_COLOR = '#d62728'
+
+# S3 transfer settings for reports: multipart (with concurrent parts) above 5 MB
+REPORT_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=5 * 1024 * 1024,
+    multipart_chunksize=5 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True
+)
+
+# Rendered charts are cached on disk (/tmp on Lambda) for reports with identical inputs
+CHART_CACHE_DIR = Path(os.getenv('CHART_CACHE_DIR', tempfile.gettempdir()))
+CHART_CACHE_TTL_SECONDS = 900
+
+# HTML template for technical report
+TECHNICAL_REPORT_TEMPLATE = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Bedrock Technical Report</title>
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background: #232F3E; color: white; padding: 20px; }
+        .section { margin: 20px 0; padding: 15px; border: 1px solid #ddd; }
+        .metric { display: inline-block; margin: 10px; padding: 10px; background: #f5f5f5; }
+        .chart { text-align: center; margin: 20px 0; }
+        .alert { background: #ffebee; border-left: 4px solid #f44336; padding: 10px; margin: 10px 0; }
+        .success { background: #e8f5e8; border-left: 4px solid #4caf50; padding: 10px; margin: 10px 0; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        th { background-color: #f2f2f2; }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>AWS Bedrock Technical Report</h1>
+        <p>Generated on {{ report_date }} | Period: {{ start_date }} to {{ end_date }}</p>
+    </div>
+
+    <div class="section">
+        <h2>📊 Key Performance Metrics</h2>
+        <div class="metric">
+            <h3>{{ total_invocations }}</h3>
+            <p>Total API Calls</p>
+        </div>
+        <div class="metric">
+            <h3>{{ success_rate }}%</h3>
+            <p>Success Rate</p>
+        </div>
+        <div class="metric">
+            <h3>{{ avg_duration }}ms</h3>
+            <p>Avg Response Time</p>
+        </div>
+        <div class="metric">
+            <h3>{{ unique_users }}</h3>
+            <p>Active Users</p>
+        </div>
+    </div>
+
+    <div class="section">
+        <h2>🔍 Usage Analysis</h2>
+        <div class="chart">
+            <img src="data:image/webp;base64,{{ usage_chart }}" alt="Usage Chart">
+        </div>
+
+        <h3>Top Models by Usage</h3>
+        <table>
+            <tr><th>Model</th><th>Requests</th><th>Percentage</th></tr>
+            {% for model, count, percentage in top_models %}
+            <tr>
+                <td>{{ model }}</td>
+                <td>{{ count }}</td>
+                <td>{{ percentage }}%</td>
+            </tr>
+            {% endfor %}
+        </table>
+    </div>
+
+    <div class="section">
+        <h2>⚠️ Anomalies and Alerts</h2>
+        {% if anomalies %}
+            {% for anomaly in anomalies %}
+            <div class="alert">
+                <strong>{{ anomaly.type_title }}</strong>: 
+                Current value {{ anomaly.current_value }} exceeds threshold {{ anomaly.threshold }}
+                (Severity: {{ anomaly.severity }})
+            </div>
+            {% endfor %}
+        {% else %}
+            <div class="success">No anomalies detected in the reporting period.</div>
+        {% endif %}
+    </div>
+
+    <div class="section">
+        <h2>💰 Cost Analysis</h2>
+        <div class="metric">
+            <h3>${{ estimated_cost }}</h3>
+            <p>Estimated Cost</p>
+        </div>
+        <div class="metric">
+            <h3>{{ total_tokens }}</h3>
+            <p>Total Tokens</p>
+        </div>
+
+        <div class="chart">
+            <img src="data:image/webp;base64,{{ cost_chart }}" alt="Cost Chart">
+        </div>
+    </div>
+
+    <div class="section">
+        <h2>📈 Error Analysis</h2>
+        {% if error_chart %}
+        <div class="chart">
+            <img src="data:image/webp;base64,{{ error_chart }}" alt="Error Chart">
+        </div>
+        {% elif total_errors > 0 %}
+        <div class="alert">{{ total_errors }} errors detected; no per-model breakdown is available.</div>
+        {% else %}
+        <div class="success">No errors detected in the reporting period.</div>
+        {% endif %}
+    </div>
+
+    <div class="section">
+        <h2>🎯 Recommendations</h2>
+        <ul>
+        {% for recommendation in recommendations %}
+            <li>{{ recommendation }}</li>
+        {% endfor %}
+        </ul>
+    </div>
+</body>
+</html>
+"""
+
+# Compiled once at import; autoescape guards the injected metric strings
+_TECHNICAL_TEMPLATE = Environment(autoescape=True, auto_reload=False).from_string(TECHNICAL_REPORT_TEMPLATE)
+
+def _to_json(data: Any, indent: bool = False, sort_keys: bool = False) -> str:
+    """
+    Serialize report data to JSON, using orjson when it is installed
+    
+    Args:
+        data: Data to serialize (datetimes and NumPy values are supported)
+        indent: Pretty-print with two-space indentation
+        sort_keys: Sort dictionary keys (for stable output)
+        
+    Returns:
+        JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(data, default=str, option=option).decode()
+    
+    return json.dumps(data, indent=2 if indent else None, sort_keys=sort_keys, default=str)
+
+_chart_style_applied = False
+
+def _apply_chart_style():
+    """
+    Apply the chart style to matplotlib's rcParams once per process
+    
+    Warm Lambda containers reuse the process, so later reports skip reading and
+    merging the style sheet again.
+    """
+    global _chart_style_applied
+    if _chart_style_applied:
+        return
+    
+    from matplotlib import style
+    style.use('seaborn-v0_8')
+    _chart_style_applied = True
 
 class BedrockReporter:
     """
@@ -29,14 +226,49 @@ class BedrockReporter:
             region_name: AWS region
         """
         self.region_name = region_name
-        self.monitor = BedrockMonitor(region_name)
-        self.s3_client = boto3.client('s3', region_name=region_name)
-        self.ses_client = boto3.client('ses', region_name=region_name)
+        
+        # One session (credential resolution) shared with the monitor's clients
+        self.session = boto3.Session(region_name=region_name)
+        self.monitor = BedrockMonitor(region_name, session=self.session)
+        self.s3_client = self.session.client('s3', config=CLIENT_CONFIG)
+        self.ses_client = self.session.client('ses', config=CLIENT_CONFIG)
         
         # Configuration
         self.report_bucket = os.getenv('REPORT_BUCKET')
         self.sender_email = os.getenv('SENDER_EMAIL')
         
+        # Monitor results memoized for the lifetime of this reporter (one report run)
+        self._metrics_cache: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._user_behavior_cache: Dict[int, Dict[str, Any]] = {}
+        self._cost_cache: Dict[int, Dict[str, Any]] = {}
+        self._daily_counts_cache: Dict[Tuple, Dict[str, List[float]]] = {}
+        
+    def _collect_usage_metrics(self, start_time: datetime, end_time: datetime) -> Dict[str, Any]:
+        """Collect usage metrics, reusing results for windows already fetched (to the minute)"""
+        key = (int(start_time.timestamp()) // 60, int(end_time.timestamp()) // 60)
+        if key not in self._metrics_cache:
+            self._metrics_cache[key] = self.monitor.collect_usage_metrics(start_time, end_time)
+        return self._metrics_cache[key]
+    
+    def _analyze_user_behavior(self, hours_back: int) -> Dict[str, Any]:
+        """Analyze user behavior, reusing results already fetched for the same window"""
+        if hours_back not in self._user_behavior_cache:
+            self._user_behavior_cache[hours_back] = self.monitor.analyze_user_behavior(hours_back=hours_back)
+        return self._user_behavior_cache[hours_back]
+    
+    def _generate_cost_analysis(self, days_back: int) -> Dict[str, Any]:
+        """Generate cost analysis, reusing results already computed for the same window"""
+        if days_back not in self._cost_cache:
+            self._cost_cache[days_back] = self.monitor.generate_cost_analysis(days_back=days_back)
+        return self._cost_cache[days_back]
+    
+    def _get_daily_counts(self, start_time: datetime, end_time: datetime, metric_names: List[str]) -> Dict[str, List[float]]:
+        """Get daily metric counts, reusing series already fetched for the same window"""
+        key = (int(start_time.timestamp()) // 60, int(end_time.timestamp()) // 60, tuple(metric_names))
+        if key not in self._daily_counts_cache:
+            self._daily_counts_cache[key] = self.monitor.get_daily_counts(start_time, end_time, metric_names)
+        return self._daily_counts_cache[key]
+    
     def generate_executive_summary(self, days_back: int = 7) -> Dict[str, Any]:
         """
         Generate executive summary for management
@@ -47,13 +279,18 @@ class BedrockReporter:
         Returns:
             Executive summary data
         """
-        end_time = datetime.utcnow()
+        # One minute-floored timestamp per report keeps every helper's window (and cache key) aligned
+        end_time = datetime.utcnow().replace(second=0, microsecond=0)
         start_time = end_time - timedelta(days=days_back)
         
-        # Collect metrics
-        metrics = self.monitor.collect_usage_metrics(start_time, end_time)
-        user_behavior = self.monitor.analyze_user_behavior(hours_back=days_back*24)
-        cost_analysis = self.monitor.generate_cost_analysis(days_back=days_back)
+        # Collect metrics (independent CloudWatch calls, fetched concurrently)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            metrics_future = executor.submit(self._collect_usage_metrics, start_time, end_time)
+            user_behavior_future = executor.submit(self._analyze_user_behavior, days_back*24)
+            cost_analysis_future = executor.submit(self._generate_cost_analysis, days_back)
+            metrics = metrics_future.result()
+            user_behavior = user_behavior_future.result()
+            cost_analysis = cost_analysis_future.result()
         
         summary = {
             'reporting_period': {
@@ -70,73 +307,83 @@ class BedrockReporter:
                 'estimated_cost': cost_analysis.get('total_estimated_cost', 0)
             },
             'trends': {
-                'usage_growth': self._calculate_usage_growth(days_back),
-                'error_trend': self._calculate_error_trend(days_back),
-                'cost_trend': self._calculate_cost_trend(days_back)
+                'usage_growth': self._calculate_usage_growth(days_back, now=end_time),
+                'error_trend': self._calculate_error_trend(days_back, now=end_time),
+                'cost_trend': self._calculate_cost_trend(days_back, now=end_time)
             },
-            'top_models': list(user_behavior.get('model_preferences', {}).keys())[:5],
+            'top_models': [model for model, _ in Counter(user_behavior.get('model_preferences', {})).most_common(5)],
             'recommendations': self._generate_recommendations(metrics, user_behavior, cost_analysis)
         }
         
         return summary
     
-    def _calculate_usage_growth(self, days_back: int) -> float:
+    def _daily_usage(self, days_back: int, now: datetime) -> Dict[str, np.ndarray]:
+        """
+        Get daily usage and token arrays covering the current and previous periods
+        
+        One GetMetricData request covers both periods, oldest day first, so the
+        trend helpers share a single fetch and slice it.
+        """
+        end_time = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        start_time = end_time - timedelta(days=days_back*2)
+        daily = self._get_daily_counts(
+            start_time, end_time, ['Invocations', 'Errors', 'InputTokens', 'OutputTokens']
+        )
+        return {name: np.asarray(values, dtype=float) for name, values in daily.items()}
+    
+    def _calculate_usage_growth(self, days_back: int, now: datetime) -> float:
         """Calculate usage growth percentage"""
         try:
-            # Get current period metrics
-            current_end = datetime.utcnow()
-            current_start = current_end - timedelta(days=days_back)
-            current_metrics = self.monitor.collect_usage_metrics(current_start, current_end)
+            # Split the daily invocations into previous and current periods
+            invocations = self._daily_usage(days_back, now)['Invocations']
+            previous_total = invocations[:-days_back].sum()
+            current_total = invocations[-days_back:].sum()
             
-            # Get previous period metrics
-            previous_end = current_start
-            previous_start = previous_end - timedelta(days=days_back)
-            previous_metrics = self.monitor.collect_usage_metrics(previous_start, previous_end)
-            
-            if previous_metrics['total_invocations'] > 0:
-                growth = ((current_metrics['total_invocations'] - previous_metrics['total_invocations']) / 
-                         previous_metrics['total_invocations']) * 100
-                return round(growth, 2)
+            if previous_total > 0:
+                growth = ((current_total - previous_total) / previous_total) * 100
+                return round(float(growth), 2)
             
             return 0.0
         except Exception:
             return 0.0
     
-    def _calculate_error_trend(self, days_back: int) -> str:
+    def _calculate_error_trend(self, days_back: int, now: datetime) -> str:
         """Calculate error trend"""
         try:
-            # Get daily error rates for trend analysis
-            daily_error_rates = []
-            for i in range(days_back):
-                day_start = datetime.utcnow() - timedelta(days=i+1)
-                day_end = day_start + timedelta(days=1)
-                daily_metrics = self.monitor.collect_usage_metrics(day_start, day_end)
-                
-                if daily_metrics['total_invocations'] > 0:
-                    error_rate = (daily_metrics['total_errors'] / daily_metrics['total_invocations']) * 100
-                    daily_error_rates.append(error_rate)
+            # Daily invocation and error counts for the current period
+            daily = self._daily_usage(days_back, now)
+            invocations = daily['Invocations'][-days_back:]
+            errors = daily['Errors'][-days_back:]
             
-            if len(daily_error_rates) >= 2:
-                if daily_error_rates[0] > daily_error_rates[-1]:
-                    return "Improving"
-                elif daily_error_rates[0] < daily_error_rates[-1]:
-                    return "Worsening"
-                else:
-                    return "Stable"
+            # Daily error rates, skipping days without traffic
+            days = np.flatnonzero(invocations > 0)
+            if days.size < 2:
+                return "Insufficient Data"
+            error_rates = errors[days] / invocations[days] * 100
             
-            return "Insufficient Data"
+            # Classify by the least-squares slope (percentage points per day)
+            slope = np.polyfit(days, error_rates, 1)[0]
+            if slope < -0.1:
+                return "Improving"
+            elif slope > 0.1:
+                return "Worsening"
+            else:
+                return "Stable"
         except Exception:
             return "Unknown"
     
-    def _calculate_cost_trend(self, days_back: int) -> str:
+    def _calculate_cost_trend(self, days_back: int, now: datetime) -> str:
         """Calculate cost trend"""
         try:
-            # Get current week cost
-            current_cost = self.monitor.generate_cost_analysis(days_back=days_back)
-            previous_cost = self.monitor.generate_cost_analysis(days_back=days_back*2)
+            # Daily token costs for both periods from the shared daily series
+            daily = self._daily_usage(days_back, now)
+            input_cost, output_cost = self.monitor.estimate_token_cost(
+                daily['InputTokens'], daily['OutputTokens']
+            )
+            daily_cost = input_cost + output_cost
             
-            current_total = current_cost.get('total_estimated_cost', 0)
-            previous_total = previous_cost.get('total_estimated_cost', 0) / 2  # Adjust for double period
+            current_total = daily_cost[-days_back:].sum()
+            previous_total = daily_cost[:-days_back].sum()
             
             if previous_total > 0:
                 change = ((current_total - previous_total) / previous_total) * 100
@@ -191,141 +438,43 @@ class BedrockReporter:
         Returns:
             HTML report content
         """
-        # Collect comprehensive data
-        end_time = datetime.utcnow()
+        # Collect comprehensive data over one minute-floored window shared by all helpers
+        end_time = datetime.utcnow().replace(second=0, microsecond=0)
         start_time = end_time - timedelta(days=days_back)
         
-        metrics = self.monitor.collect_usage_metrics(start_time, end_time)
-        user_behavior = self.monitor.analyze_user_behavior(hours_back=days_back*24)
-        cost_analysis = self.monitor.generate_cost_analysis(days_back=days_back)
-        anomalies = self.monitor.detect_anomalies()
+        # Independent CloudWatch calls, fetched concurrently
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            metrics_future = executor.submit(self._collect_usage_metrics, start_time, end_time)
+            user_behavior_future = executor.submit(self._analyze_user_behavior, days_back*24)
+            cost_analysis_future = executor.submit(self._generate_cost_analysis, days_back)
+            anomalies_future = executor.submit(self.monitor.detect_anomalies)
+            daily_future = executor.submit(self._daily_usage, days_back, end_time)
+            metrics = metrics_future.result()
+            user_behavior = user_behavior_future.result()
+            cost_analysis = cost_analysis_future.result()
+            anomalies = anomalies_future.result()
+            
+            # Daily series errors propagate so failures aren't cached; degrade to an empty chart here
+            try:
+                daily_invocations = daily_future.result()['Invocations'][-days_back:].tolist()
+            except Exception as e:
+                print(f"Error getting daily usage: {str(e)}")
+                daily_invocations = []
         
         # Create visualizations
-        charts = self._create_charts(metrics, user_behavior, cost_analysis)
-        
-        # HTML template for technical report
-        template_str = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Bedrock Technical Report</title>
-            <style>
-                body { font-family: Arial, sans-serif; margin: 20px; }
-                .header { background: #232F3E; color: white; padding: 20px; }
-                .section { margin: 20px 0; padding: 15px; border: 1px solid #ddd; }
-                .metric { display: inline-block; margin: 10px; padding: 10px; background: #f5f5f5; }
-                .chart { text-align: center; margin: 20px 0; }
-                .alert { background: #ffebee; border-left: 4px solid #f44336; padding: 10px; margin: 10px 0; }
-                .success { background: #e8f5e8; border-left: 4px solid #4caf50; padding: 10px; margin: 10px 0; }
-                table { width: 100%; border-collapse: collapse; }
-                th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
-                th { background-color: #f2f2f2; }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>AWS Bedrock Technical Report</h1>
-                <p>Generated on {{ report_date }} | Period: {{ start_date }} to {{ end_date }}</p>
-            </div>
-            
-            <div class="section">
-                <h2>📊 Key Performance Metrics</h2>
-                <div class="metric">
-                    <h3>{{ total_invocations }}</h3>
-                    <p>Total API Calls</p>
-                </div>
-                <div class="metric">
-                    <h3>{{ success_rate }}%</h3>
-                    <p>Success Rate</p>
-                </div>
-                <div class="metric">
-                    <h3>{{ avg_duration }}ms</h3>
-                    <p>Avg Response Time</p>
-                </div>
-                <div class="metric">
-                    <h3>{{ unique_users }}</h3>
-                    <p>Active Users</p>
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>🔍 Usage Analysis</h2>
-                <div class="chart">
-                    <img src="data:image/png;base64,{{ usage_chart }}" alt="Usage Chart">
-                </div>
-                
-                <h3>Top Models by Usage</h3>
-                <table>
-                    <tr><th>Model</th><th>Requests</th><th>Percentage</th></tr>
-                    {% for model, count in top_models %}
-                    <tr>
-                        <td>{{ model }}</td>
-                        <td>{{ count }}</td>
-                        <td>{{ "%.1f"|format((count/total_requests)*100) }}%</td>
-                    </tr>
-                    {% endfor %}
-                </table>
-            </div>
-            
-            <div class="section">
-                <h2>⚠️ Anomalies and Alerts</h2>
-                {% if anomalies %}
-                    {% for anomaly in anomalies %}
-                    <div class="alert">
-                        <strong>{{ anomaly.type|title }}</strong>: 
-                        Current value {{ anomaly.current_value }} exceeds threshold {{ "%.2f"|format(anomaly.threshold) }}
-                        (Severity: {{ anomaly.severity }})
-                    </div>
-                    {% endfor %}
-                {% else %}
-                    <div class="success">No anomalies detected in the reporting period.</div>
-                {% endif %}
-            </div>
-            
-            <div class="section">
-                <h2>💰 Cost Analysis</h2>
-                <div class="metric">
-                    <h3>${{ "%.2f"|format(estimated_cost) }}</h3>
-                    <p>Estimated Cost</p>
-                </div>
-                <div class="metric">
-                    <h3>{{ total_tokens }}</h3>
-                    <p>Total Tokens</p>
-                </div>
-                
-                <div class="chart">
-                    <img src="data:image/png;base64,{{ cost_chart }}" alt="Cost Chart">
-                </div>
-            </div>
-            
-            <div class="section">
-                <h2>📈 Error Analysis</h2>
-                {% if total_errors > 0 %}
-                <div class="chart">
-                    <img src="data:image/png;base64,{{ error_chart }}" alt="Error Chart">
-                </div>
-                {% else %}
-                <div class="success">No errors detected in the reporting period.</div>
-                {% endif %}
-            </div>
-            
-            <div class="section">
-                <h2>🎯 Recommendations</h2>
-                <ul>
-                {% for recommendation in recommendations %}
-                    <li>{{ recommendation }}</li>
-                {% endfor %}
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
+        charts = self._create_charts(metrics, user_behavior, cost_analysis, daily_invocations)
         
-        template = Template(template_str)
+        # Rank models once; percentages are formatted here rather than per row in Jinja
+        model_prefs = Counter(user_behavior.get('model_preferences', {}))
+        total_requests = sum(model_prefs.values())
+        top_models = [
+            (model, count, f"{count / total_requests * 100:.1f}")
+            for model, count in model_prefs.most_common(5)
+        ]
         
         # Prepare template data
         template_data = {
-            'report_date': datetime.utcnow().strftime('%Y-%m-%d %H:%M UTC'),
+            'report_date': end_time.strftime('%Y-%m-%d %H:%M UTC'),
             'start_date': start_time.strftime('%Y-%m-%d'),
             'end_date': end_time.strftime('%Y-%m-%d'),
             'total_invocations': metrics['total_invocations'],
@@ -333,70 +482,132 @@ class BedrockReporter:
             'avg_duration': round(metrics.get('avg_duration', 0)),
             'unique_users': user_behavior.get('unique_users', 0),
             'total_errors': metrics['total_errors'],
-            'estimated_cost': cost_analysis.get('total_estimated_cost', 0),
+            'estimated_cost': f"{cost_analysis.get('total_estimated_cost', 0):.2f}",
             'total_tokens': metrics['total_input_tokens'] + metrics['total_output_tokens'],
-            'top_models': list(user_behavior.get('model_preferences', {}).items())[:5],
-            'total_requests': sum(user_behavior.get('model_preferences', {}).values()),
-            'anomalies': anomalies,
+            'top_models': top_models,
+            'anomalies': [
+                {
+                    'type_title': anomaly['type'].title(),
+                    'current_value': anomaly['current_value'],
+                    'threshold': f"{anomaly['threshold']:.2f}",
+                    'severity': anomaly['severity']
+                }
+                for anomaly in anomalies
+            ],
             'recommendations': self._generate_recommendations(metrics, user_behavior, cost_analysis),
             **charts
         }
         
-        return template.render(**template_data)
+        return _TECHNICAL_TEMPLATE.render(**template_data)
     
-    def _create_charts(self, metrics: Dict, user_behavior: Dict, cost_analysis: Dict) -> Dict[str, str]:
+    def _create_charts(
+        self, 
+        metrics: Dict, 
+        user_behavior: Dict, 
+        cost_analysis: Dict, 
+        daily_invocations: List[float]
+    ) -> Dict[str, str]:
         """
-        Create visualization charts for the report
+        Create visualization charts for the report, reusing recently cached renders
+        
+        Charts are keyed by a hash of their inputs and cached for
+        CHART_CACHE_TTL_SECONDS, so repeated reports over unchanged metrics skip
+        rendering entirely.
+        
+        Args:
+            metrics: Usage metrics for the reporting period
+            user_behavior: User behavior analysis
+            cost_analysis: Cost analysis
+            daily_invocations: Invocations per day, oldest first
         
         Returns:
-            Dictionary of base64 encoded chart images
+            Dictionary of base64 encoded WebP chart images
         """
+        key = hashlib.blake2b(
+            _to_json([metrics, user_behavior, cost_analysis, daily_invocations], sort_keys=True).encode(),
+            digest_size=16
+        ).hexdigest()
+        cache_path = CHART_CACHE_DIR / f'bedrock_charts_{key}.json'
+        
+        try:
+            if time.time() - cache_path.stat().st_mtime < CHART_CACHE_TTL_SECONDS:
+                return json.loads(cache_path.read_text())
+        except (OSError, ValueError):
+            pass
+        
+        charts = self._render_charts(metrics, user_behavior, cost_analysis, daily_invocations)
+        
+        try:
+            tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_text(json.dumps(charts))
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Error caching charts: {str(e)}")
+        
+        return charts
+    
+    def _render_charts(
+        self, 
+        metrics: Dict, 
+        user_behavior: Dict, 
+        cost_analysis: Dict, 
+        daily_invocations: List[float]
+    ) -> Dict[str, str]:
+        """
+        Render visualization charts for the report
+        
+        Returns:
+            Dictionary of base64 encoded WebP chart images
+        """
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        
         charts = {}
         
         # Set style
-        plt.style.use('seaborn-v0_8')
+        _apply_chart_style()
+        
+        # One figure and Agg canvas are reused for every chart
+        fig = Figure(dpi=CHART_DPI)
+        FigureCanvasAgg(fig)
         
         try:
             # Usage chart
-            fig, ax = plt.subplots(figsize=(10, 6))
-            
-            # Sample data - in real implementation, get time series data
-            days = list(range(7, 0, -1))
-            usage_data = [metrics['total_invocations'] // 7] * 7  # Simplified
+            fig.set_size_inches(10, 6)
+            ax = fig.add_subplot()
             
-            ax.plot(days, usage_data, marker='o', linewidth=2)
-            ax.set_title('Daily API Usage Trend')
-            ax.set_xlabel('Days Ago')
-            ax.set_ylabel('API Calls')
-            ax.grid(True, alpha=0.3)
+            if daily_invocations:
+                # Daily invocations from the shared daily series, oldest first
+                days = list(range(len(daily_invocations), 0, -1))
+                
+                ax.plot(days, daily_invocations, marker='o', linewidth=2)
+                ax.invert_xaxis()
+                ax.set_title('Daily API Usage Trend')
+                ax.set_xlabel('Days Ago')
+                ax.set_ylabel('API Calls')
+                ax.grid(True, alpha=0.3)
+            else:
+                ax.text(0.5, 0.5, 'No usage data available', ha='center', va='center', transform=ax.transAxes)
+                ax.set_title('Daily API Usage Trend')
             
-            # Save to base64
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-            buffer.seek(0)
-            charts['usage_chart'] = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
+            charts['usage_chart'] = self._render_chart(fig)
             
             # Model usage pie chart
-            model_prefs = user_behavior.get('model_preferences', {})
+            model_prefs = Counter(user_behavior.get('model_preferences', {}))
             if model_prefs:
-                fig, ax = plt.subplots(figsize=(8, 8))
+                fig.set_size_inches(8, 8)
+                ax = fig.add_subplot()
                 
-                models = list(model_prefs.keys())[:5]  # Top 5 models
-                values = list(model_prefs.values())[:5]
+                models, values = zip(*model_prefs.most_common(5))  # Top 5 models
                 
-                colors = plt.cm.Set3(range(len(models)))
-                ax.pie(values, labels=models, colors=colors, autopct='%1.1f%%', startangle=90)
+                ax.pie(values, labels=models, colors=_MODEL_COLORS[:len(models)], autopct='%1.1f%%', startangle=90)
                 ax.set_title('Model Usage Distribution')
                 
-                buffer = BytesIO()
-                plt.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-                buffer.seek(0)
-                charts['model_chart'] = base64.b64encode(buffer.getvalue()).decode()
-                plt.close()
+                charts['model_chart'] = self._render_chart(fig)
             
             # Cost breakdown chart
-            fig, ax = plt.subplots(figsize=(8, 6))
+            fig.set_size_inches(8, 6)
+            ax = fig.add_subplot()
             
             input_cost = cost_analysis.get('input_token_cost', 0)
             output_cost = cost_analysis.get('output_token_cost', 0)
@@ -405,7 +616,7 @@ class BedrockReporter:
                 categories = ['Input Tokens', 'Output Tokens']
                 costs = [input_cost, output_cost]
                 
-                ax.bar(categories, costs, color=['#1f77b4', '#ff7f0e'])
+                ax.bar(categories, costs, color=_COST_COLORS)
                 ax.set_title('Cost Breakdown by Token Type')
                 ax.set_ylabel('Estimated Cost ($)')
                 
@@ -416,44 +627,51 @@ class BedrockReporter:
                 ax.text(0.5, 0.5, 'No cost data available', ha='center', va='center', transform=ax.transAxes)
                 ax.set_title('Cost Breakdown')
             
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-            buffer.seek(0)
-            charts['cost_chart'] = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
+            charts['cost_chart'] = self._render_chart(fig)
             
-            # Error distribution chart
-            if metrics['total_errors'] > 0:
-                fig, ax = plt.subplots(figsize=(8, 6))
+            # Error distribution chart (errors per model from the usage metrics)
+            error_distribution = Counter({
+                model: count for model, count in metrics.get('error_distribution', {}).items() if count > 0
+            })
+            if error_distribution:
+                fig.set_size_inches(8, 6)
+                ax = fig.add_subplot()
                 
-                # Sample error distribution - in real implementation, get actual error types
-                error_types = ['ClientError', 'ServerError', 'ThrottlingError', 'ValidationError']
-                error_counts = [metrics['total_errors'] // 4] * 4  # Simplified
+                error_models, error_counts = zip(*error_distribution.most_common(10))
                 
-                ax.bar(error_types, error_counts, color='#d62728')
-                ax.set_title('Error Distribution')
+                ax.bar(error_models, error_counts, color=_ERROR_COLOR)
+                ax.set_title('Error Distribution by Model')
                 ax.set_ylabel('Error Count')
                 ax.tick_params(axis='x', rotation=45)
                 
-                buffer = BytesIO()
-                plt.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-                buffer.seek(0)
-                charts['error_chart'] = base64.b64encode(buffer.getvalue()).decode()
-                plt.close()
+                charts['error_chart'] = self._render_chart(fig)
             
         except Exception as e:
             print(f"Error creating charts: {str(e)}")
             # Create placeholder chart
-            fig, ax = plt.subplots(figsize=(8, 6))
+            fig.clear()
+            fig.set_size_inches(8, 6)
+            ax = fig.add_subplot()
             ax.text(0.5, 0.5, 'Chart generation error', ha='center', va='center', transform=ax.transAxes)
-            buffer = BytesIO()
-            plt.savefig(buffer, format='png', bbox_inches='tight', dpi=150)
-            buffer.seek(0)
-            charts['usage_chart'] = base64.b64encode(buffer.getvalue()).decode()
-            plt.close()
+            charts['usage_chart'] = self._render_chart(fig)
         
         return charts
     
+    @staticmethod
+    def _render_chart(fig: 'Figure') -> str:
+        """
+        Render a figure to a base64 encoded lossless WebP and clear it for the next chart
+        
+        Margins come from tight_layout rather than bbox_inches='tight', which
+        would render the figure twice. Lossless WebP is several times smaller
+        than PNG for these flat-colour charts.
+        """
+        fig.tight_layout()
+        buffer = BytesIO()
+        fig.canvas.print_webp(buffer, pil_kwargs={'lossless': True, 'method': 4})
+        fig.clear()
+        return base64.b64encode(buffer.getbuffer()).decode('ascii')
+    
     def send_report(self, report_html: str, recipients: List[str], subject: str = "Bedrock Monitoring Report"):
         """
         Send report via email
@@ -467,16 +685,22 @@ class BedrockReporter:
             print("Sender email not configured")
             return
         
+        message = {
+            'Subject': {'Data': subject},
+            'Body': {'Html': {'Data': report_html}}
+        }
+        
+        def send(recipient: str):
+            return self.ses_client.send_email(
+                Source=self.sender_email,
+                Destination={'ToAddresses': [recipient]},
+                Message=message
+            )
+        
         try:
-            for recipient in recipients:
-                self.ses_client.send_email(
-                    Source=self.sender_email,
-                    Destination={'ToAddresses': [recipient]},
-                    Message={
-                        'Subject': {'Data': subject},
-                        'Body': {'Html': {'Data': report_html}}
-                    }
-                )
+            # One email per recipient keeps addresses private; send them concurrently
+            with ThreadPoolExecutor(max_workers=min(10, len(recipients) or 1)) as executor:
+                list(executor.map(send, recipients))
             print(f"Report sent to {len(recipients)} recipients")
         except Exception as e:
             print(f"Error sending report: {str(e)}")
@@ -495,11 +719,18 @@ class BedrockReporter:
         
         try:
             key = f"reports/{datetime.utcnow().strftime('%Y/%m/%d')}/{report_name}.html"
-            self.s3_client.put_object(
-                Bucket=self.report_bucket,
-                Key=key,
-                Body=report_html,
-                ContentType='text/html'
+            # HTML compresses well; S3 serves it with Content-Encoding so browsers inflate it.
+            # upload_fileobj switches to parallel multipart uploads for large reports
+            self.s3_client.upload_fileobj(
+                BytesIO(gzip.compress(report_html.encode('utf-8'), compresslevel=6)),
+                self.report_bucket,
+                key,
+                ExtraArgs={
+                    'ContentType': 'text/html; charset=utf-8',
+                    'ContentEncoding': 'gzip',
+                    'CacheControl': 'max-age=3600'
+                },
+                Config=REPORT_TRANSFER_CONFIG
             )
             print(f"Report saved to s3://{self.report_bucket}/{key}")
         except Exception as e:
@@ -529,7 +760,7 @@ def lambda_handler(event, context):
         
         return {
             'statusCode': 200,
-            'body': json.dumps({
+            'body': _to_json({
                 'message': 'Reports generated successfully',
                 'technical_report_saved': True,
                 'executive_summary': exec_summary
@@ -560,4 +791,4 @@ if __name__ == "__main__":
     # Generate executive summary
     summary = reporter.generate_executive_summary(days_back=7)
     print("\nExecutive Summary:")
-    print(json.dumps(summary, indent=2, default=str))
\ No newline at end of file
+    print(_to_json(summary, indent=True))
\ No newline at end of file
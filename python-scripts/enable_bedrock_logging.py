@@ -6,7 +6,10 @@ This script enables comprehensive logging for AWS Bedrock services
 import boto3
 import json
 import logging
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Set, Tuple
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # Configure logging
@@ -16,6 +19,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Shared by every client: keep-alive connections, a pool sized for concurrent checks, adaptive retries
+CLIENT_CONFIG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    max_pool_connections=50
+)
+
+# Standard resource naming shared by every environment
+LOG_GROUP_PREFIX = '/aws/bedrock/model-invocations/'
+
+def _resource_names(environment: str, account_id: str) -> Tuple[str, str, str]:
+    """Return the (log group, S3 bucket, S3 key prefix) names for an environment"""
+    return (
+        f'{LOG_GROUP_PREFIX}{environment}',
+        f'bedrock-model-invocations-{environment}-{account_id}',
+        f'model-invocations/{environment}/'
+    )
+
+# (level, message, *args) entries collected by concurrent checks and passed to logger.log
+LogEntries = List[Tuple[Any, ...]]
+
+class _LazyJson:
+    """Defers JSON formatting of a log argument until a handler actually emits it"""
+    
+    def __init__(self, data: Any):
+        self.data = data
+    
+    def __str__(self) -> str:
+        return json.dumps(self.data, indent=2, default=str)
+
+@lru_cache(maxsize=None)
+def _get_client(service_name: str, region_name: str):
+    """Return a process-wide boto3 client for the service and region"""
+    return boto3.client(service_name, region_name=region_name, config=CLIENT_CONFIG)
+
+@lru_cache(maxsize=1)
+def _caller_identity(region_name: str) -> Dict[str, Any]:
+    """Return the STS caller identity, looked up at most once per process"""
+    return _get_client('sts', region_name).get_caller_identity()
+
 class BedrockLoggingEnabler:
     """
     Enables and configures logging for AWS Bedrock services
@@ -29,9 +72,9 @@ class BedrockLoggingEnabler:
             region_name: AWS region to configure logging
         """
         self.region_name = region_name
-        self.bedrock_client = boto3.client('bedrock', region_name=region_name)
-        self.logs_client = boto3.client('logs', region_name=region_name)
-        self.s3_client = boto3.client('s3', region_name=region_name)
+        self.bedrock_client = _get_client('bedrock', region_name)
+        self.logs_client = _get_client('logs', region_name)
+        self.s3_client = _get_client('s3', region_name)
         
     def enable_model_invocation_logging(
         self, 
@@ -145,49 +188,75 @@ class BedrockLoggingEnabler:
             logger.error(f"❌ Unexpected error disabling Bedrock logging: {str(e)}")
             return False
     
-    def verify_logging_setup(self, log_group_name: str, s3_bucket_name: str) -> Dict[str, bool]:
+    def verify_logging_setup(
+        self,
+        log_group_name: str,
+        s3_bucket_name: str,
+        checks: Optional[Set[str]] = None
+    ) -> Dict[str, bool]:
         """
         Verify that logging prerequisites are in place
         
         Args:
             log_group_name: CloudWatch Log Group name to verify
             s3_bucket_name: S3 bucket name to verify
+            checks: Result keys to verify (all checks if not provided)
             
         Returns:
-            Dictionary with verification results
+            Dictionary with verification results for the requested checks
         """
-        results = {
-            'log_group_exists': False,
-            's3_bucket_exists': False,
-            'bedrock_logging_enabled': False
+        available_checks = {
+            'log_group_exists': (self._check_log_group, log_group_name),
+            's3_bucket_exists': (self._check_s3_bucket, s3_bucket_name),
+            'bedrock_logging_enabled': (self._check_bedrock_logging,)
+        }
+        selected_checks = {
+            key: check for key, check in available_checks.items()
+            if checks is None or key in checks
         }
         
-        # Check if CloudWatch Log Group exists
+        # The checks are independent AWS calls, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(selected_checks)) as executor:
+            futures = {key: executor.submit(*check) for key, check in selected_checks.items()}
+        
+        # Log after joining so output order doesn't depend on which call returned first
+        results = {}
+        for key, future in futures.items():
+            results[key], messages = future.result()
+            for level, message, *args in messages:
+                logger.log(level, message, *args)
+        
+        return results
+    
+    def _check_log_group(self, log_group_name: str) -> Tuple[bool, LogEntries]:
+        """Check if CloudWatch Log Group exists"""
         try:
-            self.logs_client.describe_log_groups(logGroupNamePrefix=log_group_name)
-            results['log_group_exists'] = True
-            logger.info(f"✅ CloudWatch Log Group exists: {log_group_name}")
+            # Groups are listed by name, so an exact match is on the first page of prefix matches
+            response = self.logs_client.describe_log_groups(logGroupNamePrefix=log_group_name, limit=50)
+            if any(group['logGroupName'] == log_group_name for group in response.get('logGroups', [])):
+                return True, [(logging.INFO, f"✅ CloudWatch Log Group exists: {log_group_name}")]
         except ClientError:
-            logger.warning(f"⚠️  CloudWatch Log Group not found: {log_group_name}")
+            pass
         
-        # Check if S3 bucket exists
+        return False, [(logging.WARNING, f"⚠️  CloudWatch Log Group not found: {log_group_name}")]
+    
+    def _check_s3_bucket(self, s3_bucket_name: str) -> Tuple[bool, LogEntries]:
+        """Check if S3 bucket exists"""
         try:
             self.s3_client.head_bucket(Bucket=s3_bucket_name)
-            results['s3_bucket_exists'] = True
-            logger.info(f"✅ S3 Bucket exists: {s3_bucket_name}")
+            return True, [(logging.INFO, f"✅ S3 Bucket exists: {s3_bucket_name}")]
         except ClientError:
-            logger.warning(f"⚠️  S3 Bucket not found or not accessible: {s3_bucket_name}")
-        
-        # Check if Bedrock logging is enabled
+            return False, [(logging.WARNING, f"⚠️  S3 Bucket not found or not accessible: {s3_bucket_name}")]
+    
+    def _check_bedrock_logging(self) -> Tuple[bool, LogEntries]:
+        """Check if Bedrock logging is enabled"""
         config = self.get_model_invocation_logging_configuration()
         if config:
-            results['bedrock_logging_enabled'] = True
-            logger.info("✅ Bedrock model invocation logging is enabled")
-            logger.info(f"   Current config: {json.dumps(config, indent=2, default=str)}")
-        else:
-            logger.warning("⚠️  Bedrock model invocation logging is not enabled")
-        
-        return results
+            return True, [
+                (logging.INFO, "✅ Bedrock model invocation logging is enabled"),
+                (logging.INFO, "   Current config: %s", _LazyJson(config))
+            ]
+        return False, [(logging.WARNING, "⚠️  Bedrock model invocation logging is not enabled")]
     
     def setup_comprehensive_logging(
         self, 
@@ -207,13 +276,10 @@ class BedrockLoggingEnabler:
         try:
             # Get account ID if not provided
             if not account_id:
-                sts = boto3.client('sts')
-                account_id = sts.get_caller_identity()['Account']
+                account_id = _caller_identity(self.region_name)['Account']
             
             # Define resource names
-            log_group_name = f'/aws/bedrock/model-invocations/{environment}'
-            s3_bucket_name = f'bedrock-model-invocations-{environment}-{account_id}'
-            s3_key_prefix = f'model-invocations/{environment}/'
+            log_group_name, s3_bucket_name, s3_key_prefix = _resource_names(environment, account_id)
             
             logger.info(f"🚀 Setting up comprehensive Bedrock logging for environment: {environment}")
             logger.info(f"   Account ID: {account_id}")
@@ -246,7 +312,13 @@ class BedrockLoggingEnabler:
                 logger.info("ℹ️  Bedrock logging is already enabled")
             
             # Final verification
-            final_verification = self.verify_logging_setup(log_group_name, s3_bucket_name)
+            # Log group and bucket were proven above; only the logging configuration can have changed
+            final_verification = {
+                **verification,
+                **self.verify_logging_setup(
+                    log_group_name, s3_bucket_name, checks={'bedrock_logging_enabled'}
+                )
+            }
             
             if all(final_verification.values()):
                 logger.info("🎉 Comprehensive Bedrock logging setup completed successfully!")
@@ -258,19 +330,131 @@ class BedrockLoggingEnabler:
         except Exception as e:
             logger.error(f"❌ Error setting up comprehensive logging: {str(e)}")
             return False
+    
+    def verify_logging_setup_batch(
+        self,
+        environments: List[str],
+        account_id: str = None
+    ) -> Dict[str, Dict[str, bool]]:
+        """
+        Verify logging prerequisites for several environments with one call per service
+        
+        Existing log groups are listed once under the shared prefix and buckets once
+        with ListBuckets, so the cost doesn't grow with the number of environments.
+        Bedrock keeps a single invocation logging configuration per account and region,
+        so it counts as enabled only for the environment whose log group it targets.
+        
+        Args:
+            environments: Environment names (dev, staging, prod)
+            account_id: AWS Account ID (will be fetched if not provided)
+            
+        Returns:
+            Verification results keyed by environment
+        """
+        if not account_id:
+            account_id = _caller_identity(self.region_name)['Account']
+        
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            log_groups_future = executor.submit(self._list_log_group_names)
+            buckets_future = executor.submit(self._list_bucket_names)
+            config_future = executor.submit(self.get_model_invocation_logging_configuration)
+            log_groups = log_groups_future.result()
+            buckets = buckets_future.result()
+            config = config_future.result() or {}
+        
+        enabled_log_group = config.get('cloudWatchConfig', {}).get('logGroupName')
+        
+        results = {}
+        for environment in environments:
+            log_group_name, s3_bucket_name, _ = _resource_names(environment, account_id)
+            results[environment] = {
+                'log_group_exists': log_group_name in log_groups,
+                's3_bucket_exists': s3_bucket_name in buckets,
+                'bedrock_logging_enabled': enabled_log_group == log_group_name
+            }
+            
+            failed = [check for check, passed in results[environment].items() if not passed]
+            if failed:
+                logger.warning(f"⚠️  {environment}: failed {', '.join(failed)}")
+            else:
+                logger.info(f"✅ {environment}: logging setup verified")
+        
+        return results
+    
+    def _list_log_group_names(self) -> Set[str]:
+        """List the names of all log groups under the standard prefix"""
+        names = set()
+        try:
+            paginator = self.logs_client.get_paginator('describe_log_groups')
+            for page in paginator.paginate(logGroupNamePrefix=LOG_GROUP_PREFIX):
+                names.update(group['logGroupName'] for group in page.get('logGroups', []))
+        except ClientError as e:
+            logger.warning(f"⚠️  Could not list CloudWatch Log Groups: {e}")
+        return names
+    
+    def _list_bucket_names(self) -> Set[str]:
+        """List the names of all S3 buckets in the account"""
+        try:
+            return {bucket['Name'] for bucket in self.s3_client.list_buckets().get('Buckets', [])}
+        except ClientError as e:
+            logger.warning(f"⚠️  Could not list S3 Buckets: {e}")
+            return set()
+
+def _disable(enabler: BedrockLoggingEnabler, args) -> None:
+    """Disable Bedrock model invocation logging"""
+    print("⚠️  Disabling Bedrock model invocation logging...")
+    success = enabler.disable_model_invocation_logging()
+    if success:
+        print("✅ Bedrock logging disabled successfully")
+    else:
+        print("❌ Failed to disable Bedrock logging")
+
+def _verify(enabler: BedrockLoggingEnabler, args) -> None:
+    """Verify the current logging configuration for the environment"""
+    print("🔍 Verifying current Bedrock logging configuration...")
+    # Use environment-specific resource names
+    account_id = _caller_identity(args.region)['Account']
+    log_group_name, s3_bucket_name, _ = _resource_names(args.environment, account_id)
+    
+    verification = enabler.verify_logging_setup(log_group_name, s3_bucket_name)
+    
+    print("\n📊 Verification Results:")
+    for check, result in verification.items():
+        status = "✅ PASS" if result else "❌ FAIL"
+        print(f"   {check.replace('_', ' ').title()}: {status}")
+
+def _setup(enabler: BedrockLoggingEnabler, args) -> None:
+    """Set up comprehensive logging for the environment"""
+    success = enabler.setup_comprehensive_logging(environment=args.environment)
+    
+    if success:
+        print("\n🎉 Bedrock logging has been successfully configured!")
+        print("\nNext steps:")
+        print("1. Your Bedrock model invocations will now be logged")
+        print("2. Check CloudWatch Logs for real-time monitoring")
+        print("3. Review S3 bucket for long-term log storage")
+        print("4. Use the monitoring dashboards to analyze usage")
+    else:
+        print("\n❌ Failed to configure Bedrock logging")
+        print("Please check the error messages above and resolve any issues")
 
 def main():
     """
     Main function for enabling Bedrock logging
     """
     import argparse
-    import os
     
     parser = argparse.ArgumentParser(description='Enable AWS Bedrock Logging')
     parser.add_argument('--region', default='us-east-1', help='AWS region')
     parser.add_argument('--environment', default='prod', help='Environment name')
-    parser.add_argument('--verify-only', action='store_true', help='Only verify current configuration')
-    parser.add_argument('--disable', action='store_true', help='Disable Bedrock logging')
+    
+    # Each mode selects its handler at parse time; setup runs when no mode flag is given
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--verify-only', dest='func', action='store_const', const=_verify,
+                      help='Only verify current configuration')
+    mode.add_argument('--disable', dest='func', action='store_const', const=_disable,
+                      help='Disable Bedrock logging')
+    parser.set_defaults(func=_setup)
     
     args = parser.parse_args()
     
@@ -280,45 +464,7 @@ def main():
     print("🔧 AWS Bedrock Logging Configuration Tool")
     print("=" * 50)
     
-    if args.disable:
-        print("⚠️  Disabling Bedrock model invocation logging...")
-        success = enabler.disable_model_invocation_logging()
-        if success:
-            print("✅ Bedrock logging disabled successfully")
-        else:
-            print("❌ Failed to disable Bedrock logging")
-        return
-    
-    if args.verify_only:
-        print("🔍 Verifying current Bedrock logging configuration...")
-        # Use environment-specific resource names
-        sts = boto3.client('sts')
-        account_id = sts.get_caller_identity()['Account']
-        log_group_name = f'/aws/bedrock/model-invocations/{args.environment}'
-        s3_bucket_name = f'bedrock-model-invocations-{args.environment}-{account_id}'
-        
-        verification = enabler.verify_logging_setup(log_group_name, s3_bucket_name)
-        
-        print("\n📊 Verification Results:")
-        for check, result in verification.items():
-            status = "✅ PASS" if result else "❌ FAIL"
-            print(f"   {check.replace('_', ' ').title()}: {status}")
-        
-        return
-    
-    # Set up comprehensive logging
-    success = enabler.setup_comprehensive_logging(environment=args.environment)
-    
-    if success:
-        print("\n🎉 Bedrock logging has been successfully configured!")
-        print("\nNext steps:")
-        print("1. Your Bedrock model invocations will now be logged")
-        print("2. Check CloudWatch Logs for real-time monitoring")
-        print("3. Review S3 bucket for long-term log storage")
-        print("4. Use the monitoring dashboards to analyze usage")
-    else:
-        print("\n❌ Failed to configure Bedrock logging")
-        print("Please check the error messages above and resolve any issues")
+    args.func(enabler, args)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -4,22 +4,142 @@ Validates all configurations and prerequisites before deployment
 """
 
 import boto3
+import hashlib
+import importlib.util
 import json
 import os
 import sys
-from typing import Dict, List, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import re
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError
 
+# ('error' | 'warning' | 'success', message template, args) recorded by a check;
+# messages are only formatted (template % args) when they are read
+ValidationEvent = Tuple[str, str, tuple]
+ValidationResult = List[ValidationEvent]
+
+# Shared by every client: keep-alive connections, a pool sized for concurrent checks, adaptive retries
+CLIENT_CONFIG = Config(
+    retries={'max_attempts': 10, 'mode': 'adaptive'},
+    tcp_keepalive=True,
+    max_pool_connections=50
+)
+
+PARAMETERS_FILE = 'cloudformation/parameters.json'
+
+# SHA-256 digests of template bodies that have passed ValidateTemplate in this process
+_VALIDATED_TEMPLATES = set()
+
+# Accepted AlertEmail format, compiled once at import
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+REQUIRED_PARAMETERS = ['Environment', 'AlertEmail', 'CloudTrailRetentionDays', 'CloudWatchLogRetentionDays']
+
+# Parameter value checks return a validation event, or None if there is nothing to report
+def _check_alert_email(key: str, value: str) -> Optional[ValidationEvent]:
+    if not value:
+        return None
+    if not EMAIL_PATTERN.match(value):
+        return 'error', "❌ Invalid email format: %s", (value,)
+    if value == 'admin@company.com':
+        return 'warning', "⚠️  Using default email address. Update with your actual email.", ()
+    return 'success', "✅ Valid email configured: %s", (value,)
+
+def _check_environment(key: str, value: str) -> Optional[ValidationEvent]:
+    if value not in ['dev', 'staging', 'prod']:
+        return 'warning', "⚠️  Unusual environment value: %s", (value,)
+    return None
+
+def _check_retention_days(key: str, value: str) -> Optional[ValidationEvent]:
+    try:
+        days = int(value)
+    except (TypeError, ValueError):
+        return 'error', "❌ Invalid retention days value for %s: %s", (key, value)
+    if days < 1 or days > 3653:  # 10 years max
+        return 'warning', "⚠️  Unusual retention period for %s: %s days", (key, days)
+    return None
+
+PARAMETER_VALIDATORS = {
+    'AlertEmail': _check_alert_email,
+    'Environment': _check_environment,
+    'CloudTrailRetentionDays': _check_retention_days,
+    'CloudWatchLogRetentionDays': _check_retention_days
+}
+
 class ConfigValidator:
     """
     Validates configuration for Bedrock monitoring deployment
+    
+    Messages are recorded as (level, template, args) events. errors, warnings and
+    success_messages are read-only tuples formatted on access; add messages with
+    record(), not by appending to them.
     """
     
     def __init__(self):
-        self.errors = []
-        self.warnings = []
-        self.success_messages = []
+        self._events: List[ValidationEvent] = []
+        
+        # boto3 sessions aren't thread-safe; clients are created once under a lock and shared
+        self.session = boto3.Session()
+        self._clients: Dict[str, object] = {}
+        self._clients_lock = threading.Lock()
+        
+        # Parameters file contents (or the error reading it), loaded once for all checks
+        self._parameters = None
+        self._parameters_lock = threading.Lock()
+        
+    def _client(self, service_name: str):
+        """Return the shared client for a service, creating it on first use"""
+        with self._clients_lock:
+            if service_name not in self._clients:
+                self._clients[service_name] = self.session.client(service_name, config=CLIENT_CONFIG)
+            return self._clients[service_name]
+    
+    def record(self, level: str, template: str, *args):
+        """
+        Record a validation message, formatted as template % args when it is read
+        
+        Args:
+            level: 'error', 'warning' or 'success'
+            template: Message text with %-style placeholders
+            args: Values for the placeholders
+        """
+        if level not in ('error', 'warning', 'success'):
+            raise ValueError(f"Unknown validation message level: {level}")
+        self._events.append((level, template, args))
+    
+    def _messages(self, level: str) -> Tuple[str, ...]:
+        """Format the recorded messages for one level, in the order they were recorded"""
+        return tuple(template % args for event_level, template, args in self._events if event_level == level)
+    
+    @property
+    def errors(self) -> Tuple[str, ...]:
+        return self._messages('error')
+    
+    @property
+    def warnings(self) -> Tuple[str, ...]:
+        return self._messages('warning')
+    
+    @property
+    def success_messages(self) -> Tuple[str, ...]:
+        return self._messages('success')
+    
+    def _load_parameters(self):
+        """Parse the parameters file once; later calls reuse the result or re-raise its error"""
+        with self._parameters_lock:
+            if self._parameters is None:
+                try:
+                    self._parameters = (json.loads(Path(PARAMETERS_FILE).read_text()), None)
+                except Exception as e:
+                    self._parameters = (None, e)
+        
+        params, error = self._parameters
+        if error is not None:
+            raise error
+        return params
         
     def validate_all(self) -> bool:
         """
@@ -31,38 +151,48 @@ class ConfigValidator:
         print("🔍 Starting configuration validation...")
         print("=" * 50)
         
-        # Run all validation checks
-        self.validate_aws_credentials()
-        self.validate_aws_permissions()
-        self.validate_parameters_file()
-        self.validate_email_configuration()
-        self.validate_python_environment()
-        self.validate_cloudformation_templates()
+        checks = [
+            self.validate_aws_credentials,
+            self.validate_aws_permissions,
+            self.validate_parameters_file,
+            self.validate_email_configuration,
+            self.validate_python_environment,
+            self.validate_cloudformation_templates
+        ]
+        
+        # Run all validation checks concurrently (mostly AWS round-trips), merging in order
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            futures = [executor.submit(check) for check in checks]
+            for future in futures:
+                for level, template, args in future.result():
+                    self.record(level, template, *args)
         
         self.print_results()
         
-        return len(self.errors) == 0
+        return not any(level == 'error' for level, _, _ in self._events)
     
-    def validate_aws_credentials(self):
+    def validate_aws_credentials(self) -> ValidationResult:
         """Validate AWS credentials are configured"""
+        events = []
+        
         try:
-            sts = boto3.client('sts')
+            sts = self._client('sts')
             identity = sts.get_caller_identity()
             
-            self.success_messages.append(
-                f"✅ AWS credentials configured for account: {identity['Account']}"
-            )
-            self.success_messages.append(
-                f"✅ Using IAM principal: {identity['Arn']}"
-            )
+            events.append(('success', "✅ AWS credentials configured for account: %s", (identity['Account'],)))
+            events.append(('success', "✅ Using IAM principal: %s", (identity['Arn'],)))
             
         except NoCredentialsError:
-            self.errors.append("❌ AWS credentials not configured. Run 'aws configure'")
+            events.append(('error', "❌ AWS credentials not configured. Run 'aws configure'", ()))
         except Exception as e:
-            self.errors.append(f"❌ Error validating AWS credentials: {str(e)}")
+            events.append(('error', "❌ Error validating AWS credentials: %s", (e,)))
+        
+        return events
     
-    def validate_aws_permissions(self):
+    def validate_aws_permissions(self) -> ValidationResult:
         """Validate required AWS permissions"""
+        events = []
+        
         required_permissions = [
             ('cloudformation', 'list_stacks'),
             ('cloudwatch', 'list_dashboards'),
@@ -73,87 +203,91 @@ class ConfigValidator:
             ('iam', 'list_roles')
         ]
         
-        for service_name, operation in required_permissions:
-            try:
-                client = boto3.client(service_name)
-                method = getattr(client, operation)
-                method()
-                self.success_messages.append(f"✅ {service_name.upper()} permissions validated")
-            except ClientError as e:
-                if e.response['Error']['Code'] in ['AccessDenied', 'UnauthorizedOperation']:
-                    self.errors.append(f"❌ Missing {service_name.upper()} permissions")
-                else:
-                    self.warnings.append(f"⚠️  Could not validate {service_name.upper()} permissions: {e}")
-            except Exception as e:
-                self.warnings.append(f"⚠️  Error checking {service_name.upper()} permissions: {e}")
+        # One probe per service, all in flight at once; results are recorded in list order
+        with ThreadPoolExecutor(max_workers=len(required_permissions)) as executor:
+            futures = [
+                executor.submit(self._probe_permission, service_name, operation)
+                for service_name, operation in required_permissions
+            ]
+            for future in futures:
+                events.extend(future.result())
+        
+        return events
     
-    def validate_parameters_file(self):
+    def _probe_permission(self, service_name: str, operation: str) -> ValidationResult:
+        """Call one read-only operation to check access to a service"""
+        events = []
+        
+        try:
+            client = self._client(service_name)
+            method = getattr(client, operation)
+            method()
+            events.append(('success', "✅ %s permissions validated", (service_name.upper(),)))
+        except ClientError as e:
+            if e.response['Error']['Code'] in ['AccessDenied', 'UnauthorizedOperation']:
+                events.append(('error', "❌ Missing %s permissions", (service_name.upper(),)))
+            else:
+                events.append(('warning', "⚠️  Could not validate %s permissions: %s", (service_name.upper(), e)))
+        except Exception as e:
+            events.append(('warning', "⚠️  Error checking %s permissions: %s", (service_name.upper(), e)))
+        
+        return events
+    
+    def validate_parameters_file(self) -> ValidationResult:
         """Validate CloudFormation parameters file"""
-        params_file = 'cloudformation/parameters.json'
+        events = []
         
-        if not os.path.exists(params_file):
-            self.errors.append(f"❌ Parameters file not found: {params_file}")
-            return
+        if not os.path.exists(PARAMETERS_FILE):
+            events.append(('error', "❌ Parameters file not found: %s", (PARAMETERS_FILE,)))
+            return events
         
         try:
-            with open(params_file, 'r') as f:
-                params = json.load(f)
+            params = self._load_parameters()
             
             # Validate structure
             if not isinstance(params, list):
-                self.errors.append("❌ Parameters file must contain an array of parameters")
-                return
-            
-            # Required parameters
-            required_params = ['Environment', 'AlertEmail', 'CloudTrailRetentionDays', 'CloudWatchLogRetentionDays']
-            param_keys = [p.get('ParameterKey') for p in params]
+                events.append(('error', "❌ Parameters file must contain an array of parameters", ()))
+                return events
             
-            for required in required_params:
-                if required not in param_keys:
-                    self.errors.append(f"❌ Missing required parameter: {required}")
-                else:
-                    self.success_messages.append(f"✅ Found required parameter: {required}")
-            
-            # Validate parameter values
+            # Validate parameter values in one pass, recording which keys were seen
+            value_events = []
+            seen_keys = set()
             for param in params:
                 key = param.get('ParameterKey')
-                value = param.get('ParameterValue')
-                
-                if key == 'AlertEmail' and value:
-                    if not self.is_valid_email(value):
-                        self.errors.append(f"❌ Invalid email format: {value}")
-                    elif value == 'admin@company.com':
-                        self.warnings.append("⚠️  Using default email address. Update with your actual email.")
-                    else:
-                        self.success_messages.append(f"✅ Valid email configured: {value}")
+                seen_keys.add(key)
                 
-                if key == 'Environment' and value not in ['dev', 'staging', 'prod']:
-                    self.warnings.append(f"⚠️  Unusual environment value: {value}")
-                
-                if key in ['CloudTrailRetentionDays', 'CloudWatchLogRetentionDays']:
-                    try:
-                        days = int(value)
-                        if days < 1 or days > 3653:  # 10 years max
-                            self.warnings.append(f"⚠️  Unusual retention period for {key}: {days} days")
-                    except ValueError:
-                        self.errors.append(f"❌ Invalid retention days value for {key}: {value}")
-                        
+                validator = PARAMETER_VALIDATORS.get(key)
+                outcome = validator(key, param.get('ParameterValue')) if validator else None
+                if outcome:
+                    value_events.append(outcome)
+            
+            # Required parameters
+            for required in REQUIRED_PARAMETERS:
+                if required not in seen_keys:
+                    events.append(('error', "❌ Missing required parameter: %s", (required,)))
+                else:
+                    events.append(('success', "✅ Found required parameter: %s", (required,)))
+            
+            events.extend(value_events)
+                    
         except json.JSONDecodeError as e:
-            self.errors.append(f"❌ Invalid JSON in parameters file: {e}")
+            events.append(('error', "❌ Invalid JSON in parameters file: %s", (e,)))
         except Exception as e:
-            self.errors.append(f"❌ Error reading parameters file: {e}")
+            events.append(('error', "❌ Error reading parameters file: %s", (e,)))
+        
+        return events
     
-    def validate_email_configuration(self):
+    def validate_email_configuration(self) -> ValidationResult:
         """Validate SES email configuration"""
+        events = []
+        
         try:
-            ses = boto3.client('ses')
+            ses = self._client('ses')
             verified_emails = ses.list_verified_email_addresses()
             
             # Read email from parameters
-            params_file = 'cloudformation/parameters.json'
-            if os.path.exists(params_file):
-                with open(params_file, 'r') as f:
-                    params = json.load(f)
+            if os.path.exists(PARAMETERS_FILE):
+                params = self._load_parameters()
                 
                 alert_email = None
                 for param in params:
@@ -163,109 +297,129 @@ class ConfigValidator:
                 
                 if alert_email and alert_email != 'admin@company.com':
                     if alert_email in verified_emails['VerifiedEmailAddresses']:
-                        self.success_messages.append(f"✅ Email verified in SES: {alert_email}")
+                        events.append(('success', "✅ Email verified in SES: %s", (alert_email,)))
                     else:
-                        self.warnings.append(f"⚠️  Email not verified in SES: {alert_email}")
-                        self.warnings.append("   Run: aws ses verify-email-identity --email-address your-email@domain.com")
+                        events.append(('warning', "⚠️  Email not verified in SES: %s", (alert_email,)))
+                        events.append(('warning', "   Run: aws ses verify-email-identity --email-address your-email@domain.com", ()))
             
         except ClientError as e:
             if e.response['Error']['Code'] == 'AccessDenied':
-                self.warnings.append("⚠️  Cannot validate SES configuration - missing permissions")
+                events.append(('warning', "⚠️  Cannot validate SES configuration - missing permissions", ()))
             else:
-                self.warnings.append(f"⚠️  SES validation error: {e}")
+                events.append(('warning', "⚠️  SES validation error: %s", (e,)))
         except Exception as e:
-            self.warnings.append(f"⚠️  Error checking SES configuration: {e}")
+            events.append(('warning', "⚠️  Error checking SES configuration: %s", (e,)))
+        
+        return events
     
-    def validate_python_environment(self):
+    def validate_python_environment(self) -> ValidationResult:
         """Validate Python environment and dependencies"""
+        events = []
+        
         # Check Python version
         python_version = sys.version_info
         if python_version < (3, 10):
-            self.errors.append(f"❌ Python 3.10+ required, found {python_version.major}.{python_version.minor}")
+            events.append(('error', "❌ Python 3.10+ required, found %s.%s", (python_version.major, python_version.minor)))
         else:
-            self.success_messages.append(f"✅ Python version {python_version.major}.{python_version.minor} is compatible")
+            events.append(('success', "✅ Python version %s.%s is compatible", (python_version.major, python_version.minor)))
         
         # Check required packages
         required_packages = [
-            'boto3', 'pandas', 'matplotlib', 'seaborn', 'jinja2', 'numpy'
+            'boto3', 'matplotlib', 'jinja2', 'numpy'
         ]
         
         missing_packages = []
         for package in required_packages:
-            try:
-                __import__(package)
-                self.success_messages.append(f"✅ Package installed: {package}")
-            except ImportError:
+            # find_spec only locates the package; importing matplotlib/numpy would cost seconds
+            if importlib.util.find_spec(package) is None:
                 missing_packages.append(package)
+            else:
+                events.append(('success', "✅ Package installed: %s", (package,)))
         
         if missing_packages:
-            self.warnings.append(f"⚠️  Missing Python packages: {', '.join(missing_packages)}")
-            self.warnings.append("   Run: pip install -r python-scripts/requirements.txt")
+            events.append(('warning', "⚠️  Missing Python packages: %s", (', '.join(missing_packages),)))
+            events.append(('warning', "   Run: pip install -r python-scripts/requirements.txt", ()))
+        
+        return events
     
-    def validate_cloudformation_templates(self):
+    def validate_cloudformation_templates(self) -> ValidationResult:
         """Validate CloudFormation templates"""
+        events = []
+        
         templates = [
             'cloudformation/bedrock-monitoring-infrastructure.yaml',
             'cloudformation/bedrock-monitoring-dashboards.yaml'
         ]
         
-        cf = boto3.client('cloudformation')
+        # Templates are validated independently, so read and validate them concurrently
+        with ThreadPoolExecutor(max_workers=len(templates)) as executor:
+            futures = [executor.submit(self._validate_template, path) for path in templates]
+            for future in futures:
+                events.extend(future.result())
         
-        for template_path in templates:
-            if not os.path.exists(template_path):
-                self.errors.append(f"❌ CloudFormation template not found: {template_path}")
-                continue
+        return events
+    
+    def _validate_template(self, template_path: str) -> ValidationResult:
+        """Read one CloudFormation template and validate its syntax"""
+        events = []
+        
+        path = Path(template_path)
+        if not path.exists():
+            events.append(('error', "❌ CloudFormation template not found: %s", (template_path,)))
+            return events
+        
+        try:
+            template_body = path.read_bytes()
+            template_hash = hashlib.sha256(template_body).hexdigest()
             
-            try:
-                with open(template_path, 'r') as f:
-                    template_body = f.read()
-                
-                # Validate template syntax
-                cf.validate_template(TemplateBody=template_body)
-                self.success_messages.append(f"✅ Template validated: {template_path}")
-                
-            except ClientError as e:
-                self.errors.append(f"❌ Template validation failed for {template_path}: {e}")
-            except Exception as e:
-                self.errors.append(f"❌ Error reading template {template_path}: {e}")
+            # Validate template syntax, unless this exact content already passed in this process
+            if template_hash not in _VALIDATED_TEMPLATES:
+                self._client('cloudformation').validate_template(TemplateBody=template_body.decode('utf-8'))
+                _VALIDATED_TEMPLATES.add(template_hash)
+            events.append(('success', "✅ Template validated: %s", (template_path,)))
+            
+        except ClientError as e:
+            events.append(('error', "❌ Template validation failed for %s: %s", (template_path, e)))
+        except Exception as e:
+            events.append(('error', "❌ Error reading template %s: %s", (template_path, e)))
+        
+        return events
     
     def is_valid_email(self, email: str) -> bool:
         """Validate email address format"""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return EMAIL_PATTERN.match(email) is not None
     
     def print_results(self):
         """Print validation results"""
-        print("\n" + "=" * 50)
-        print("📊 VALIDATION RESULTS")
-        print("=" * 50)
+        # Messages are formatted here, once; then the whole report is written at once
+        errors, warnings, successes = self.errors, self.warnings, self.success_messages
+        lines = ["", "=" * 50, "📊 VALIDATION RESULTS", "=" * 50]
         
-        if self.errors:
-            print("\n❌ ERRORS (Must be fixed before deployment):")
-            for error in self.errors:
-                print(f"   {error}")
+        if errors:
+            lines.append("\n❌ ERRORS (Must be fixed before deployment):")
+            lines.extend(f"   {error}" for error in errors)
         
-        if self.warnings:
-            print("\n⚠️  WARNINGS (Recommended to address):")
-            for warning in self.warnings:
-                print(f"   {warning}")
+        if warnings:
+            lines.append("\n⚠️  WARNINGS (Recommended to address):")
+            lines.extend(f"   {warning}" for warning in warnings)
         
-        if self.success_messages:
-            print("\n✅ SUCCESS:")
-            for success in self.success_messages:
-                print(f"   {success}")
+        if successes:
+            lines.append("\n✅ SUCCESS:")
+            lines.extend(f"   {success}" for success in successes)
         
-        print("\n" + "=" * 50)
+        lines.append("\n" + "=" * 50)
         
-        if self.errors:
-            print(f"❌ VALIDATION FAILED: {len(self.errors)} error(s) found")
-            print("🔧 Please fix the errors above before proceeding with deployment.")
+        if errors:
+            lines.append(f"❌ VALIDATION FAILED: {len(errors)} error(s) found")
+            lines.append("🔧 Please fix the errors above before proceeding with deployment.")
         else:
-            print("✅ VALIDATION PASSED: Ready for deployment!")
-            if self.warnings:
-                print(f"⚠️  {len(self.warnings)} warning(s) found - review recommendations above.")
+            lines.append("✅ VALIDATION PASSED: Ready for deployment!")
+            if warnings:
+                lines.append(f"⚠️  {len(warnings)} warning(s) found - review recommendations above.")
         
-        print("=" * 50)
+        lines.append("=" * 50)
+        
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def generate_fix_suggestions(self) -> List[str]:
         """Generate specific fix suggestions based on errors found"""